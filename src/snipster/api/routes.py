@@ -5,7 +5,12 @@ from loguru import logger
 from pydantic_core import ValidationError as PydanticValidationError
 
 from snipster.api.dependencies import get_repo
-from snipster.api.schemas import MessageResponse, SnippetCreate, SnippetResponse
+from snipster.api.schemas import (
+    MessageResponse,
+    SnippetCreate,
+    SnippetMessageResponse,
+    SnippetResponse,
+)
 from snipster.exceptions import (
     DuplicateSnippetError,
     MultipleSnippetsFoundError,
@@ -124,12 +129,15 @@ def search_snippets(
         )
 
 
-@router.post("/snippets/v1/{snippet_id}/favourite", response_model=MessageResponse)
+@router.post(
+    "/snippets/v1/{snippet_id}/favourite", response_model=SnippetMessageResponse
+)
 def toggle_favourite(*, repo: SnippetRepository = Depends(get_repo), snippet_id: int):
     try:
         favourited = repo.toggle_favourite(snippet_id)
         action = "Favourited" if favourited else "Unfavourited"
         logger.debug(f"Snippet '{snippet_id}' {action}")
+        snippet = repo.get(snippet_id)
     except SnippetNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -139,10 +147,16 @@ def toggle_favourite(*, repo: SnippetRepository = Depends(get_repo), snippet_id:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
         )
-    return {"message": f"Snippet '{snippet_id}' is {action}"}
+    if snippet is None:
+        # Deleted by another request between the toggle and the read-back
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Snippet '{snippet_id}' not found",
+        )
+    return {"message": f"Snippet '{snippet_id}' is {action}", "snippet": snippet}
 
 
-@router.post("/snippets/v1/{snippet_id}/tags", response_model=MessageResponse)
+@router.post("/snippets/v1/{snippet_id}/tags", response_model=SnippetMessageResponse)
 def tag_snippet(
     *,
     repo: SnippetRepository = Depends(get_repo),
@@ -154,6 +168,7 @@ def tag_snippet(
     try:
         repo.tags(snippet_id, *tags, remove=remove, sort=sort)
         logger.debug(f"Tag snippets for snippet '{snippet_id}'")
+        snippet = repo.get(snippet_id)
     except SnippetNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -163,8 +178,18 @@ def tag_snippet(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
         )
+    if snippet is None:
+        # Deleted by another request between the tag update and the read-back
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Snippet '{snippet_id}' not found",
+        )
     if remove:
         return {
-            "message": f"Successfully removed the following tags '{", ".join(tags)}' for snippet '{snippet_id}'"
+            "message": f"Successfully removed the following tags '{", ".join(tags)}' for snippet '{snippet_id}'",
+            "snippet": snippet,
         }
-    return {"message": f"Successfully tagged snippet '{snippet_id}'"}
+    return {
+        "message": f"Successfully tagged snippet '{snippet_id}'",
+        "snippet": snippet,
+    }
@@ -38,3 +38,9 @@ class MessageResponse(BaseModel):
     """Schema for API response - custom messages"""
 
     message: str = Field(..., description="Message to send to end user")
+
+
+class SnippetMessageResponse(MessageResponse):
+    """Schema for API response - custom message with the updated snippet"""
+
+    snippet: SnippetResponse = Field(..., description="Snippet after the update")
@@ -1,17 +1,36 @@
 """Database manager works with any SQLModel"""
 
+from contextlib import closing, contextmanager
 from datetime import datetime, timezone
-from typing import Any, Type
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Type
+from weakref import WeakSet
 
 from decouple import config
 from loguru import logger
-from sqlalchemy import func
+from sqlalchemy import (
+    Connection,
+    Engine,
+    UniqueConstraint,
+    bindparam,
+    column,
+    event,
+    func,
+    insert,
+    make_url,
+    or_,
+    text,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import (
     IntegrityError,
     MultipleResultsFound,
     NoResultFound,
     OperationalError,
 )
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql import Executable
 from sqlmodel import (
     Session,
     SQLModel,
@@ -25,24 +44,207 @@ from snipster.exceptions import (
     SnippetNotFoundError,
 )
 
+# The trigram tokenizer only matches terms of at least three characters
+FTS_MIN_TERM_LENGTH = 3
+
+# Applied to every connection of a file-backed SQLite database
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Engines whose tables were created and committed; entries go away with the engine
+SCHEMA_CREATED: WeakSet[Engine] = WeakSet()
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+INSERT_CONSTRUCTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
 
 class DatabaseManager:
-    def __init__(self, db_url: str | None = None, echo: bool = False):
-        if db_url is None:
+    def __init__(
+        self,
+        db_url: str | None = None,
+        echo: bool = False,
+        connection: Connection | None = None,
+    ):
+        if connection is not None:
+            db_url = connection.engine.url.render_as_string(hide_password=False)
+        elif db_url is None:
             db_url = config("DATABASE_URL", default="sqlite:///snippets.db")
 
         if db_url.strip() == "":
             raise ValueError("db_url cannot be empty")
 
         self.db_url = db_url
-        self.engine = create_engine(self.db_url, echo=echo)
+        if connection is not None:
+            self.engine = connection.engine
+        else:
+            url = make_url(self.db_url)
+            if url.get_backend_name() != "sqlite":
+                self.engine = create_engine(url, echo=echo)
+            elif url.database in (None, "", ":memory:") or (
+                url.query.get("mode") == "memory"
+            ):
+                # One connection shared across threads keeps an in-memory
+                # database alive and visible to every request worker
+                self.engine = create_engine(
+                    url,
+                    echo=echo,
+                    poolclass=StaticPool,
+                    connect_args={"check_same_thread": False},
+                )
+            else:
+                self.engine = create_engine(url, echo=echo)
+                event.listen(self.engine, "connect", self._apply_sqlite_pragmas)
+        self._bind = connection if connection is not None else self.engine
+        self._fts_tables: dict[str, str] = {}
+        self._statements: dict[tuple, Executable] = {}
         self.create_db_and_models()
 
+    @staticmethod
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Use WAL journaling so readers don't block the writer and commits fsync less"""
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
     def create_db_and_models(self):
-        """Create database and models/tables"""
-        SQLModel.metadata.create_all(self.engine)
+        """
+        Create database and models/tables, once per engine.
+
+        Managers sharing an engine whose schema is already committed skip the
+        DDL. A schema created inside a caller's open transaction may still be
+        rolled back, so the engine is not recorded in that case.
+        """
+        if self.engine in SCHEMA_CREATED:
+            logger.debug("Database and models already created")
+            return
+        if not isinstance(self._bind, Connection):
+            SQLModel.metadata.create_all(self._bind)
+            SCHEMA_CREATED.add(self.engine)
+        elif self._bind.in_transaction():
+            SQLModel.metadata.create_all(self._bind)
+        else:
+            with self._bind.begin():
+                SQLModel.metadata.create_all(self._bind)
+            SCHEMA_CREATED.add(self.engine)
         logger.info("Database and models created")
 
+    def _session(self) -> Session:
+        """
+        Open a session on the manager's bind.
+
+        When the manager wraps an external connection, session commits and
+        rollbacks are scoped to a SAVEPOINT so the connection owner keeps
+        control of the outer transaction.
+        """
+        return Session(self._bind, join_transaction_mode="create_savepoint")
+
+    @contextmanager
+    def _begin(self) -> Iterator[Connection]:
+        """Run a block of statements in a single transaction on the manager's bind"""
+        if isinstance(self._bind, Connection):
+            with self._bind.begin_nested():
+                yield self._bind
+        else:
+            with self.engine.begin() as conn:
+                yield conn
+
+    def create_fts_index(self, model: Type[SQLModel], cols: list[str]) -> bool:
+        """
+        Create an SQLite FTS5 index over the given columns of a model table.
+
+        The index is an external content table kept in sync with the model
+        table by AFTER INSERT/UPDATE/DELETE triggers, and is populated from
+        existing rows the first time it is created. The update trigger only
+        fires when an indexed column changes.
+
+        Args:
+            model: The SQLModel class to index
+            cols: Model fields to include in the index
+
+        Returns:
+            True if the index is available, False otherwise
+        """
+        if self.engine.dialect.name != "sqlite":
+            logger.debug(f"Full-text index not supported on {self.engine.dialect.name}")
+            return False
+
+        for col in cols:
+            if not hasattr(model, col):
+                raise ValueError(
+                    f"Column '{col}' does not exist in model {model.__name__}"
+                )
+
+        table = model.__tablename__
+        fts_table = f"{table}_fts"
+        fts_cols = ", ".join(cols)
+        new_cols = ", ".join(f"new.{col}" for col in cols)
+        old_cols = ", ".join(f"old.{col}" for col in cols)
+        insert_new = (
+            f"INSERT INTO {fts_table}(rowid, {fts_cols}) VALUES (new.id, {new_cols});"
+        )
+        delete_old = (
+            f"INSERT INTO {fts_table}({fts_table}, rowid, {fts_cols}) "
+            f"VALUES ('delete', old.id, {old_cols});"
+        )
+        # Only edits to indexed columns need re-indexing, not favourite or tag updates
+        update_trigger = (
+            f"CREATE TRIGGER {fts_table}_au AFTER UPDATE OF {fts_cols} "
+            f"ON {table} BEGIN {delete_old} {insert_new} END"
+        )
+        try:
+            with self._begin() as conn:
+                exists = conn.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (fts_table,),
+                ).first()
+                if not exists:
+                    conn.exec_driver_sql(
+                        f"CREATE VIRTUAL TABLE {fts_table} USING fts5("
+                        f"{fts_cols}, content='{table}', content_rowid='id', "
+                        "tokenize='trigram')"
+                    )
+                    conn.exec_driver_sql(
+                        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT "
+                        f"ON {table} BEGIN {insert_new} END"
+                    )
+                    conn.exec_driver_sql(
+                        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE "
+                        f"ON {table} BEGIN {delete_old} END"
+                    )
+                    conn.exec_driver_sql(
+                        f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')"
+                    )
+                # Replace update triggers left by older versions with a different body
+                current_trigger = conn.exec_driver_sql(
+                    "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+                    (f"{fts_table}_au",),
+                ).scalar()
+                if current_trigger != update_trigger:
+                    conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {fts_table}_au")
+                    conn.exec_driver_sql(update_trigger)
+        except OperationalError as err:
+            logger.warning(f"Full-text index on model {model.__name__} disabled: {err}")
+            return False
+
+        self._fts_tables[table] = fts_table
+        logger.info(f"Full-text index {fts_table} created")
+        return True
+
+    def _statement(self, key: tuple, build: Callable[[], Executable]) -> Executable:
+        """Build a parameterized statement once and reuse it on later calls"""
+        statement = self._statements.get(key)
+        if statement is None:
+            statement = self._statements[key] = build()
+        return statement
+
+    def has_fts_index(self, model: Type[SQLModel]) -> bool:
+        """Check whether a full-text index is available for the model table"""
+        return model.__tablename__ in self._fts_tables
+
     def select_by_id(self, model: Type[SQLModel], pk: int) -> SQLModel | None:
         """
         Fetch a single record by its primary key.
@@ -57,7 +259,7 @@ class DatabaseManager:
         Raises:
             RepositoryError: If the database operation fails.
         """
-        with Session(self.engine) as session:
+        with self._session() as session:
             try:
                 return session.get(model, pk)
             except OperationalError as err:
@@ -68,6 +270,51 @@ class DatabaseManager:
                     f"Select by id {pk} on model {model.__name__} failed: {err}"
                 ) from err
 
+    def _select_column_statement(self, model: Type[SQLModel], col: str) -> Executable:
+        """Build the single-column lookup by primary key shared by reads and modify"""
+        return self._statement(
+            (model, "select_column", col),
+            lambda: select(getattr(model, col)).where(model.id == bindparam("pk")),
+        )
+
+    def select_column(self, model: Type[SQLModel], col: str, pk: int) -> Any:
+        """
+        Fetch a single column value of a record by its primary key.
+
+        Args:
+            model: The SQLModel class to query
+            col: Model field to fetch
+            pk: Primary key value of the record
+
+        Returns:
+            The value stored in the column
+
+        Raises:
+            SnippetNotFoundError: If no record exists for the primary key.
+            RepositoryError: If the database operation fails.
+        """
+        if not hasattr(model, col):
+            raise ValueError(f"Column '{col}' does not exist in model {model.__name__}")
+
+        with self._session() as session:
+            try:
+                statement = self._select_column_statement(model, col)
+                return session.exec(statement, params={"pk": pk}).one()
+            except NoResultFound as err:
+                logger.error(
+                    f"Record with id {pk} does not exist in model {model.__name__}"
+                )
+                raise SnippetNotFoundError(
+                    f"Record with id {pk} does not exist in model {model.__name__}"
+                ) from err
+            except OperationalError as err:
+                logger.error(
+                    f"Select column {col} for id {pk} on model {model.__name__} failed: {err}"
+                )
+                raise RepositoryError(
+                    f"Select column {col} for id {pk} on model {model.__name__} failed: {err}"
+                ) from err
+
     def select_all(
         self, model: Type[SQLModel], limit: int = None
     ) -> list[SQLModel] | None:
@@ -84,7 +331,7 @@ class DatabaseManager:
         Raises:
             RepositoryError: If the database operation fails.
         """
-        with Session(self.engine) as session:
+        with self._session() as session:
             try:
                 statement = select(model).limit(limit)
                 results = session.exec(statement)
@@ -99,15 +346,52 @@ class DatabaseManager:
             except NoResultFound:  # pragma: no cover
                 logger.warning(f"No result found in model {model.__name__}")
 
+    def stream_all(
+        self, model: Type[SQLModel], batch_size: int = 200
+    ) -> Iterator[list[SQLModel]]:
+        """
+        Stream all records from a model table in fixed-size partitions.
+
+        Rows are fetched from the cursor `batch_size` at a time instead of
+        being buffered up front, so memory stays bounded for large tables.
+        The session and cursor stay open until the generator is exhausted or
+        closed; callers that may stop early should wrap it in
+        `contextlib.closing` so they are released straight away.
+
+        Args:
+            model: The SQLModel class to query
+            batch_size: Number of records per partition
+
+        Yields:
+            Lists of at most `batch_size` records
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        with self._session() as session:
+            try:
+                statement = select(model).execution_options(yield_per=batch_size)
+                with closing(session.exec(statement)) as result:
+                    for partition in result.partitions():
+                        yield list(partition)
+            except OperationalError as err:
+                logger.error(
+                    f"Stream all records on model {model.__name__} failed: {err}"
+                )
+                raise RepositoryError(
+                    f"Stream all records on model {model.__name__} failed: {err}"
+                ) from err
+
     def select_with_filter(
-        self, model: Type[SQLModel], col: str, term: str = ""
+        self, model: Type[SQLModel], col: str | list[str], term: str = ""
     ) -> list[SQLModel] | None:
         """
         Filter records by partial matching from a model table.
 
         Args:
             model: The SQLModel class to query
-            col: Model field to filter on
+            col: Model field, or list of fields, to filter on. A record
+                matches if any of the fields matches.
             term: Pattern to match (optional)
 
         Returns:
@@ -116,19 +400,27 @@ class DatabaseManager:
         Raises:
             RepositoryError: If the database operation fails.
         """
+        cols = [col] if isinstance(col, str) else col
         escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-        with Session(self.engine) as session:
+        with self._session() as session:
             try:
-                if not hasattr(model, col):
-                    raise ValueError(
-                        f"Column '{col}' does not exist in model {model.__name__}"
-                    )
+                for name in cols:
+                    if not hasattr(model, name):
+                        raise ValueError(
+                            f"Column '{name}' does not exist in model {model.__name__}"
+                        )
 
-                column = getattr(model, col)
                 statement = select(model).filter(
-                    func.coalesce(column, "").ilike(f"%{escaped}%", escape="\\")
+                    or_(
+                        *(
+                            func.coalesce(getattr(model, name), "").ilike(
+                                bindparam("term"), escape="\\"
+                            )
+                            for name in cols
+                        )
+                    )
                 )
-                results = session.exec(statement)
+                results = session.exec(statement, params={"term": f"%{escaped}%"})
                 return results.all()
             except OperationalError as err:
                 logger.error(
@@ -138,6 +430,46 @@ class DatabaseManager:
                     f"Select by filter on model {model.__name__} failed: {err}"
                 ) from err
 
+    def select_with_fts(self, model: Type[SQLModel], term: str) -> list[SQLModel]:
+        """
+        Filter records by substring matching against the model's full-text index.
+
+        Args:
+            model: The SQLModel class to query
+            term: Pattern to match; must be at least FTS_MIN_TERM_LENGTH characters
+
+        Returns:
+            List of all matching records ordered by id, or empty list if none found
+
+        Raises:
+            RepositoryError: If the database operation fails.
+        """
+        fts_table = self._fts_tables.get(model.__tablename__)
+        if fts_table is None:
+            raise ValueError(f"No full-text index exists for model {model.__name__}")
+
+        # Quote the term as an FTS5 string so operators in it are matched literally
+        phrase = '"' + term.replace('"', '""') + '"'
+        matched_ids = (
+            text(f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH :term")
+            .bindparams(term=phrase)
+            .columns(column("rowid"))
+        )
+        with self._session() as session:
+            try:
+                statement = (
+                    select(model).where(model.id.in_(matched_ids)).order_by(model.id)
+                )
+                results = session.exec(statement)
+                return results.all()
+            except OperationalError as err:
+                logger.error(
+                    f"Full-text search on model {model.__name__} failed: {err}"
+                )
+                raise RepositoryError(
+                    f"Full-text search on model {model.__name__} failed: {err}"
+                ) from err
+
     @staticmethod
     def _load_batches(session, records: list[SQLModel]):
         """Load batches into table"""
@@ -165,7 +497,7 @@ class DatabaseManager:
             DuplicateSnippetError: If a duplicate snippet was inserted.
             RepositoryError: If the database operation fails.
         """
-        with Session(self.engine) as session:
+        with self._session() as session:
             logger.debug("Inserting single model instance")
             try:
                 self._load_batches(session, [record])
@@ -187,52 +519,119 @@ class DatabaseManager:
         logger.info(f"Successfully inserted record into model {model.__name__}")
         return True
 
+    def _insert_ignoring_duplicates(self, model: Type[SQLModel]) -> Executable:
+        """Build a multi-row INSERT that skips rows violating a unique constraint"""
+        insert_construct = INSERT_CONSTRUCTS.get(self.engine.dialect.name)
+        if insert_construct is None:
+            return insert(model)
+        return insert_construct(model).on_conflict_do_nothing()
+
     def insert_records(
         self,
         model: Type[SQLModel],
-        records: list[SQLModel],
-        batch_size: int = int(config("DEFAULT_BATCH_SIZE", 1)),
+        records: Iterable[SQLModel | dict],
+        batch_size: int = config("DEFAULT_BATCH_SIZE", default=1000, cast=int),
     ) -> int:
         """
         Insert records into the database with duplicate handling.
 
+        Each batch is sent as a batched INSERT ... ON CONFLICT DO NOTHING ...
+        RETURNING, so duplicates are skipped by the database. A batch the
+        database rejects outright is rolled back and retried row by row.
+        Generated primary keys are copied back onto inserted model instances
+        by matching the returned rows on the model's unique constraint columns.
+        Models without one cannot conflict, so their rows are returned in
+        parameter order instead, which SQLite executes one row at a time. Plain
+        dict rows are validated against the model before they are sent.
+
         Args:
             model: The SQLModel class to insert records into
-            records: List of model instances to insert
+            records: Model instances or column mappings to insert; consumed lazily
+                one batch at a time
             batch_size: Number of records to insert per transaction
 
         Returns:
             Number of records successfully inserted
         """
-        n_rows_inserted, n_dups = 0, 0
-        with Session(self.engine) as session:
-            n_rows = len(records)
-            for row in range(0, n_rows, batch_size):
+        table = model.__table__
+        unique_cols = next(
+            (
+                list(constraint.columns.keys())
+                for constraint in table.constraints
+                if isinstance(constraint, UniqueConstraint)
+            ),
+            [],
+        )
+        statement = self._statement(
+            (model, "insert_records"),
+            lambda: self._insert_ignoring_duplicates(model).returning(
+                table.c.id,
+                *(table.c[col] for col in unique_cols),
+                sort_by_parameter_order=not unique_cols,
+            ),
+        )
+
+        def backfill_ids(batch, rows, inserted):
+            """Copy returned ids onto records, skipping rows the database ignored"""
+            if not unique_cols:
+                ids = [pk for (pk,) in inserted]
+            else:
+                returned = {tuple(values): pk for pk, *values in inserted}
+                ids = [
+                    returned.pop(tuple(row[col] for col in unique_cols), None)
+                    for row in rows
+                ]
+            for record, pk in zip(batch, ids):
+                if pk is not None and not isinstance(record, dict):
+                    record.id = pk
+
+        n_rows, n_rows_inserted, n_failed = 0, 0, 0
+        records = iter(records)
+        with self._session() as session:
+            while batch := list(islice(records, batch_size)):
+                row = n_rows
+                n_rows += len(batch)
                 logger.debug(f"Processing batch {row}..{row + batch_size}")
+                rows = [
+                    (
+                        model.model_validate(record)
+                        if isinstance(record, dict)
+                        else record
+                    ).model_dump(exclude={"id"})
+                    for record in batch
+                ]
                 try:
-                    self._load_batches(session, records[row : row + batch_size])
-                except IntegrityError:
+                    inserted = session.execute(statement, rows).all()
+                    session.commit()
+                except (IntegrityError, OperationalError) as err:
                     logger.warning(
-                        f"Duplicate record found in batch {row}..{row + batch_size}."
+                        f"Batch {row}..{row + batch_size} rejected for model {model.__name__}: {err}"
                     )
                     session.rollback()
-                    logger.info("Retrying failed batches")
-                    failed_batches = records[row : row + batch_size]
-                    for record in failed_batches:
+                    logger.info("Retrying failed batch row by row")
+                    for record, values in zip(batch, rows):
                         try:
-                            self._load_batches(session, [record])
-                        except IntegrityError:
+                            inserted = session.execute(statement, [values]).all()
+                            session.commit()
+                        except (IntegrityError, OperationalError) as err:
+                            logger.debug(f"Skipping record {values}: {err}")
                             session.rollback()
-                            n_dups += 1
-                except OperationalError as err:
-                    logger.error(
-                        f"Insert statement failed for model {model.__name__}: {err}"
-                    )
-                    session.rollback()
+                            n_failed += 1
+                            continue
+                        n_rows_inserted += len(inserted)
+                        backfill_ids([record], [values], inserted)
+                    continue
+
+                n_rows_inserted += len(inserted)
+                backfill_ids(batch, rows, inserted)
 
+        n_dups = n_rows - n_rows_inserted - n_failed
         if n_dups > 0:
             logger.info(f"Number of duplicates skipped {n_dups}")
-        n_rows_inserted = n_rows - n_dups
+        if n_failed > 0:
+            logger.error(
+                f"Number of records that failed to insert into model {model.__name__}: {n_failed}"
+            )
         logger.info(
             f"Successfully inserted {n_rows_inserted} records into model {model.__name__}"
         )
@@ -253,11 +652,14 @@ class DatabaseManager:
         Raises:
             RepositoryError: If the database operation fails.
         """
-        with Session(self.engine) as session:
+        with self._session() as session:
             logger.debug("Deleting single model instance")
             try:
-                statement = select(model).where(model.id == pk)
-                record = session.exec(statement)
+                statement = self._statement(
+                    (model, "select_by_pk"),
+                    lambda: select(model).where(model.id == bindparam("pk")),
+                )
+                record = session.exec(statement, params={"pk": pk})
                 to_delete = record.one()
                 logger.debug(f"Record to delete {to_delete}")
                 session.delete(to_delete)
@@ -300,24 +702,63 @@ class DatabaseManager:
             None
 
         Raises:
+            ValidationError: If the value fails model validation.
+            RepositoryError: If the database operation fails.
+        """
+        self.modify(model, pk, col, lambda _: value)
+
+    def modify(
+        self, model: SQLModel, pk: int, col: str, transform: Callable[[Any], Any]
+    ) -> Any:
+        """
+        Read, transform and write back one field of a single record in one transaction.
+
+        Only the column itself is fetched, and it is written back with an UPDATE
+        rather than by loading and flushing the whole row. The new value is still
+        run through the model's assignment validation before it is written.
+
+        Args:
+            model: The SQLModel class to update a single record
+            pk: Unique record identifer
+            col: Model field to update
+            transform: Called with the current value; its result is stored
+
+        Returns:
+            The stored value
+
+        Raises:
+            SnippetNotFoundError: If no record exists for the primary key.
+            ValidationError: If the new value fails model validation.
             RepositoryError: If the database operation fails.
         """
-        with Session(self.engine) as session:
+        with self._session() as session:
             logger.debug(f"Updating single model instance id {pk}")
             try:
                 if not hasattr(model, col):
                     raise ValueError(
                         f"Column '{col}' does not exist in model {model.__name__}"
                     )
-                statement = select(model).where(model.id == pk)
-                record = session.exec(statement)
-                model_obj = record.one()
-
-                setattr(model_obj, col, value)
-                setattr(model_obj, "updated_at", datetime.now(timezone.utc))
-                session.add(model_obj)
+                select_statement = self._select_column_statement(model, col)
+                current = session.exec(select_statement, params={"pk": pk}).one()
+
+                value = model.__pydantic_validator__.validate_assignment(
+                    model.model_construct(), col, transform(current)
+                ).__dict__[col]
+                update_statement = self._statement(
+                    (model, "modify", col),
+                    lambda: update(model)
+                    .where(model.id == bindparam("pk"))
+                    .values({col: bindparam("value"), "updated_at": bindparam("now")}),
+                )
+                session.exec(
+                    update_statement,
+                    params={
+                        "pk": pk,
+                        "value": value,
+                        "now": datetime.now(timezone.utc),
+                    },
+                )
                 session.commit()
-                session.refresh(model_obj)
             except NoResultFound as err:
                 logger.error(
                     f"Record with id {pk} does not exist in model {model.__name__}"
@@ -334,6 +775,60 @@ class DatabaseManager:
                     f"Update failed for {model.__name__} id {pk}: {err}"
                 ) from err
 
+        return value
+
+    def toggle(self, model: SQLModel, pk: int, col: str) -> bool:
+        """
+        Flip a boolean field of a single record in one UPDATE ... RETURNING.
+
+        Args:
+            model: The SQLModel class to update a single record
+            pk: Unique record identifer
+            col: Boolean model field to flip
+
+        Returns:
+            The new value of the field
+
+        Raises:
+            SnippetNotFoundError: If no record exists for the primary key.
+            RepositoryError: If the database operation fails.
+        """
+        if not hasattr(model, col):
+            raise ValueError(f"Column '{col}' does not exist in model {model.__name__}")
+
+        column_ = getattr(model, col)
+        with self._session() as session:
+            logger.debug(f"Toggling {col} for single model instance id {pk}")
+            try:
+                statement = self._statement(
+                    (model, "toggle", col),
+                    lambda: update(model)
+                    .where(model.id == bindparam("pk"))
+                    .values({col: ~column_, "updated_at": bindparam("now")})
+                    .returning(column_),
+                )
+                value = session.exec(
+                    statement, params={"pk": pk, "now": datetime.now(timezone.utc)}
+                ).scalar_one()
+                session.commit()
+            except NoResultFound as err:
+                logger.error(
+                    f"Record with id {pk} does not exist in model {model.__name__}"
+                )
+                raise SnippetNotFoundError(
+                    f"Record with id {pk} does not exist in model {model.__name__}"
+                ) from err
+            except OperationalError as err:
+                logger.error(
+                    f"Toggle statement failed for id {pk} in model {model.__name__}: {err}"
+                )
+                session.rollback()
+                raise RepositoryError(
+                    f"Toggle failed for {model.__name__} id {pk}: {err}"
+                ) from err
+
+        return value
+
 
 if __name__ == "__main__":  # pragma: no cover
     snippet_db = DatabaseManager()
@@ -6,6 +6,7 @@ from loguru import logger
 
 from snipster.models import Snippet
 from snipster.repositories.repository import SnippetRepository
+from snipster.types import Language
 
 
 class InMemorySnippetRepository(SnippetRepository):
@@ -35,10 +36,9 @@ class InMemorySnippetRepository(SnippetRepository):
         matches = []
         if language:
             logger.info(f"Searching for the term `{term}` in the {language} language")
+            lang = Language.lookup(language)
             snippets = [
-                snippet
-                for k, snippet in self._data.items()
-                if language and snippet.language.value.lower() == language.lower()
+                snippet for k, snippet in self._data.items() if snippet.language == lang
             ]
         else:
             logger.info(f"Searching for the term `{term}`")
@@ -1,15 +1,16 @@
 """JSON backend repository"""
 
-import json
 from pathlib import Path
 from typing import List
 
+import orjson
 from loguru import logger
 
 from snipster.models import Snippet
 from snipster.repositories.repository import SnippetRepository
 
 PROJECT_ROOT = Path("pyproject.toml").resolve().parent
+JSONL_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
 
 
 class JSONSnippetRepository(SnippetRepository):
@@ -33,9 +34,9 @@ class JSONSnippetRepository(SnippetRepository):
         snippet_dict = {}
         filepath = self.full_filepath
         try:
-            with open(filepath, "r") as json_read:
+            with open(filepath, "rb") as json_read:
                 for line in json_read:
-                    record = json.loads(line)
+                    record = orjson.loads(line)
                     snippet_dict[record.get("id")] = Snippet(**record)
         except FileNotFoundError:
             logger.warning(f"JSONL Snippet file {filepath} not found")
@@ -51,14 +52,13 @@ class JSONSnippetRepository(SnippetRepository):
                 logger.warning(f"Duplicate snippet {snippet} for id {key} found")
                 return None
 
-        with open(self.full_filepath, "a") as f:
+        with open(self.full_filepath, "ab") as f:
             snippet.id = self._next_id
             self._data[self._next_id] = snippet
             self._next_id += 1
             snippet.created_at = str(snippet.created_at)
             snippet.updated_at = str(snippet.updated_at)
-            json.dump(snippet.model_dump(mode="json"), f, sort_keys=True)
-            f.write("\n")
+            f.write(orjson.dumps(snippet.model_dump(mode="json"), option=JSONL_OPTIONS))
 
         logger.info(f"Data contains {self._data}")
         logger.info(f"Successfully added snippet {snippet} to jsonl file")
@@ -76,10 +76,13 @@ class JSONSnippetRepository(SnippetRepository):
             )
         else:
             self._data.pop(snippet_id)
-            with open(self.full_filepath, "w") as f:
+            with open(self.full_filepath, "wb") as f:
                 for row, snippet in self._data.items():
-                    json.dump(snippet.model_dump(mode="json"), f, sort_keys=True)
-                    f.write("\n")
+                    f.write(
+                        orjson.dumps(
+                            snippet.model_dump(mode="json"), option=JSONL_OPTIONS
+                        )
+                    )
             logger.info(f"Snippet id {snippet_id} removed from JSON file")
 
     def search(self, term: str, *, language: str | None = None) -> List[Snippet]:
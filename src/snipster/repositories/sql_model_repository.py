@@ -1,10 +1,15 @@
 """SQLModel backend repository"""
 
-from typing import List
+import time
+from contextlib import closing
+from itertools import chain
+from typing import Iterator, List
 
+from decouple import config
 from loguru import logger
+from sqlalchemy import Connection
 
-from snipster.database_manager import DatabaseManager
+from snipster.database_manager import FTS_MIN_TERM_LENGTH, DatabaseManager
 from snipster.exceptions import (
     DuplicateSnippetError,
     RepositoryError,
@@ -14,13 +19,32 @@ from snipster.models import Snippet
 from snipster.repositories.repository import SnippetRepository
 from snipster.types import Language
 
+SEARCH_COLUMNS = ["title", "code", "description"]
+LIST_CACHE_TTL = float(config("LIST_CACHE_TTL", default=30))
+
 
 class SQLModelRepository(SnippetRepository):
     """SQLModel implementation of the abstract base class"""
 
-    def __init__(self, db_url: str | None = None, echo: bool = False):
+    def __init__(
+        self,
+        db_url: str | None = None,
+        echo: bool = False,
+        cache_ttl: float = LIST_CACHE_TTL,
+        connection: Connection | None = None,
+    ):
         self.db_url = db_url
-        self.db_manager = DatabaseManager(self.db_url, echo)
+        self.db_manager = DatabaseManager(self.db_url, echo, connection=connection)
+        self.db_manager.create_fts_index(Snippet, SEARCH_COLUMNS)
+        self.cache_ttl = cache_ttl
+        self._list_cache: list[Snippet] | None = None
+        self._list_cached_at = 0.0
+        self._list_generation = 0
+
+    def _invalidate_list_cache(self) -> None:
+        """Drop the cached `list()` result once a write has finished"""
+        self._list_generation += 1
+        self._list_cache = None
 
     def add(self, snippet: Snippet) -> None:
         try:
@@ -31,71 +55,114 @@ class SQLModelRepository(SnippetRepository):
         except RepositoryError:
             logger.warning(f"Failed to add snippet: {snippet}")
             raise
+        finally:
+            self._invalidate_list_cache()
         logger.info("Added a single record successfully")
 
+    def bulk_add(self, snippets: List[Snippet]) -> int:
+        """Insert many snippets in a single transaction
+
+        Args:
+            snippets: Snippets to insert
+
+        Returns:
+            Number of snippets inserted, excluding skipped duplicates
+        """
+        try:
+            return self.db_manager.insert_records(
+                Snippet, snippets, batch_size=max(len(snippets), 1)
+            )
+        finally:
+            self._invalidate_list_cache()
+
     def list(self) -> List[Snippet]:
-        return list(self.db_manager.select_all(Snippet))
+        now = time.monotonic()
+        snippets = self._list_cache
+        if snippets is None or now - self._list_cached_at > self.cache_ttl:
+            # A write that lands during the read bumps the generation; its rows
+            # are still returned but not cached as fresh
+            generation = self._list_generation
+            with closing(self.iter_batches()) as batches:
+                snippets = list(chain.from_iterable(batches))
+            if generation == self._list_generation:
+                self._list_cache = snippets
+                self._list_cached_at = now
+        return list(snippets)
+
+    def iter_batches(self, batch_size: int = 200) -> Iterator[List[Snippet]]:
+        """Stream all snippets in batches without materializing the full table
+
+        Close the returned generator, e.g. with `contextlib.closing`, if it
+        may not be consumed to the end.
+        """
+        return self.db_manager.stream_all(Snippet, batch_size)
 
     def get(self, snippet_id: int) -> Snippet | None:
         return self.db_manager.select_by_id(Snippet, snippet_id)
 
     def delete(self, snippet_id: int) -> None:
-        self.db_manager.delete_record(Snippet, snippet_id)
+        try:
+            self.db_manager.delete_record(Snippet, snippet_id)
+        finally:
+            self._invalidate_list_cache()
         logger.info(f"Record id {snippet_id} deleted successfully")
 
     def search(self, term: str, *, language: str | None = None) -> List[Snippet]:
-        cols_to_search = ["title", "code", "description"]
-        all_snippets = {}
-        for col in cols_to_search:
-            snippets = self.db_manager.select_with_filter(Snippet, col, term)
-            for snippet in snippets:
-                if snippet.id not in all_snippets:
-                    all_snippets[snippet.id] = snippet
-        if not all_snippets:
+        if self.db_manager.has_fts_index(Snippet) and len(term) >= FTS_MIN_TERM_LENGTH:
+            snippets = self.db_manager.select_with_fts(Snippet, term)
+        else:
+            snippets = self.db_manager.select_with_filter(Snippet, SEARCH_COLUMNS, term)
+        if not snippets:
             logger.warning(f"No matches found for term '{term}' in the Snippets model")
             return []
         if language:
+            lang = Language.lookup(language)
             lang_filtered_snippets = [
-                snippet
-                for snippet in all_snippets.values()
-                if snippet.language.value.lower() == language.lower()
+                snippet for snippet in snippets if snippet.language == lang
             ]
             if not lang_filtered_snippets:
                 logger.warning(
                     f"No matches found for term '{term}' and language {language} in the Snippets model"
                 )
             return lang_filtered_snippets
-        return list(all_snippets.values())
+        return list(snippets)
 
     def toggle_favourite(self, snippet_id: int) -> bool:
-        snippet = self.get(snippet_id)
-        if snippet:
-            snippet.favorite = not snippet.favorite
-        else:
+        try:
+            favorite = self.db_manager.toggle(Snippet, snippet_id, "favorite")
+        except SnippetNotFoundError as err:
             logger.error(f"Snippet with id {snippet_id} not found")
-            raise SnippetNotFoundError(f"Snippet with id {snippet_id} not found")
+            raise SnippetNotFoundError(
+                f"Snippet with id {snippet_id} not found"
+            ) from err
+        finally:
+            self._invalidate_list_cache()
 
-        self.db_manager.update(Snippet, snippet_id, "favorite", snippet.favorite)
-        if snippet.favorite:
+        if favorite:
             logger.info(f"Successfully favourited snippet id {snippet_id}")
         else:
             logger.info(f"Successfully unfavourited snippet id {snippet_id}")
 
-        return snippet.favorite
+        return favorite
 
     def tags(
         self, snippet_id: int, /, *tags: str, remove: bool = False, sort: bool = True
     ) -> None:
-        snippet = self.get(snippet_id)
-        if snippet:
-            logger.info(f"Updating tags {tags} for snippet {snippet_id}")
-            snippet.tags = self.process_tags(snippet.tags, tags, remove, sort)
-
-        else:
+        logger.info(f"Updating tags {tags} for snippet {snippet_id}")
+        try:
+            self.db_manager.modify(
+                Snippet,
+                pk=snippet_id,
+                col="tags",
+                transform=lambda current_tags: self.process_tags(
+                    current_tags, tags, remove, sort
+                ),
+            )
+        except SnippetNotFoundError as err:
             logger.error(f"Snippet id {snippet_id} not found")
-            raise SnippetNotFoundError(f"Snippet id {snippet_id} not found")
-
-        self.db_manager.update(Snippet, pk=snippet_id, col="tags", value=snippet.tags)
+            raise SnippetNotFoundError(f"Snippet id {snippet_id} not found") from err
+        finally:
+            self._invalidate_list_cache()
         logger.info(f"Successfully updated tags for snippet {snippet_id}")
 
 
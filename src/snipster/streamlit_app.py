@@ -1,6 +1,11 @@
+import atexit
+import re
 import time
+from operator import itemgetter
+from urllib.parse import urlencode
 
 import httpx
+import orjson
 import streamlit as st
 from decouple import config
 from fastapi import Response, status
@@ -8,8 +13,37 @@ from loguru import logger
 
 from snipster import Language
 
-LANGUAGES = sorted([lang.value for lang in Language])
-API_URL = config("API_URL", "http://127.0.0.1:8000")
+
+@st.cache_resource(show_spinner=False)
+def load_constants() -> (
+    tuple[str, tuple[str, ...], dict[str, str], dict[str, int], dict[str, str]]
+):
+    """Read the configuration and build the lookup tables that stay the same across reruns once"""
+    api_url = config("API_URL", "http://127.0.0.1:8000")
+    languages = tuple(sorted(lang.value for lang in Language))
+    code_languages = {lang: lang.lower() for lang in languages}
+    view_to_index = {
+        "list": 0,
+        "add": 1,
+        "get": 2,
+        "search": 3,
+        "delete": 4,
+        "favourite": 5,
+        "tag": 6,
+    }
+    urls = {
+        "list_snippet": "/snippets/v1/list/",
+        "add_snippet": "/snippets/v1/",
+        "get_snippet": "/snippets/v1/{snippet_id}",
+        "search_snippet": "/snippets/v1/search/",
+        "delete_snippet": "/snippets/v1/{snippet_id}",
+        "toggle_favourite": "/snippets/v1/{snippet_id}/favourite",
+        "tag_snippets": "/snippets/v1/{snippet_id}/tags",
+    }
+    return api_url, languages, code_languages, view_to_index, urls
+
+
+API_URL, LANGUAGES, CODE_LANGUAGES, view_to_index, urls = load_constants()
 
 st.set_page_config(
     page_title="Snipster App",
@@ -27,26 +61,28 @@ def on_delete_success():
 
 
 def create_streamlit_expander(snippet: dict) -> None:
-    """Create Streamlit expander to view snippets"""
+    """Create Streamlit expander to view snippets as a single markdown element"""
+
+    language = snippet["language"]
+    code = snippet["code"]
+    fence = "`" * max(3, max(map(len, re.findall("`+", code)), default=0) + 1)
+    details = [
+        f"Favourite: {snippet['favorite']}",
+        f"Created: {snippet.get('created_date') or snippet['created_at'][:10]}",
+        f"Updated: {snippet.get('updated_date') or snippet['updated_at'][:10]}",
+    ]
+    if snippet.get("tags"):
+        details.insert(0, f"Tags: {snippet['tags']}")
+
+    body = [
+        f"{fence}{CODE_LANGUAGES.get(language) or language.lower()}\n{code}\n{fence}",
+        " · ".join(details),
+    ]
+    if snippet.get("description"):
+        body.insert(0, f"Description: {snippet['description']}")
 
     with st.expander(f"{snippet["title"]}"):
-        col1, col2, col3 = st.columns([3, 2, 1])
-        with col1:
-            if snippet.get("description"):
-                st.write(f"Description: {snippet['description']}")
-        with col3:
-            st.write(f"Created: {snippet['created_at'].split('T')[0]}")
-
-        st.code(snippet["code"], language=snippet["language"].lower())
-
-        col1, col2, col3 = st.columns([3, 2, 1])
-        with col1:
-            if snippet.get("tags"):
-                st.write(f"Tags: {snippet['tags']}")
-        with col2:
-            st.write(f"Favourite: {snippet["favorite"]}")
-        with col3:
-            st.write(f"Updated: {snippet['updated_at'].split('T')[0]}")
+        st.markdown("\n\n".join(body))
 
 
 def display_list_snippets(snippets: list[dict]) -> None:
@@ -94,15 +130,20 @@ def display_create_snippet_form():
     return submitted, snippet
 
 
+ACTION_TITLES = {
+    "find": "👁️ Get Snippet",
+    "get": "👁️ Get Snippet",
+    "delete": "🗑️ Delete Snippet",
+    "toggle": "⭐ Toggle Favourite",
+}
+
+
 def display_snippets(snippet_ids: list[int], action: str) -> int:
     """Add dropdown to list snippets for get/delete operations"""
 
-    if action and (action.lower() == "find" or action.lower() == "get"):
-        st.title("👁️ Get Snippet")
-    elif action.lower() == "delete":
-        st.title("🗑️ Delete Snippet")
-    elif action and action.lower() == "toggle":
-        st.title("⭐ Toggle Favourite")
+    title = ACTION_TITLES.get(action.lower() if action else "")
+    if title:
+        st.title(title)
 
     with st.form("Snippet IDs"):
         snippet_id = st.selectbox("Snippet ID", snippet_ids)
@@ -123,7 +164,7 @@ def display_search_snippet():
     st.title("🔎 Search Snippets")
     with st.form("Search term"):
         term = st.text_input("Term to search for")
-        language = st.selectbox("Language", [None] + LANGUAGES)
+        language = st.selectbox("Language", (None, *LANGUAGES))
         submitted = st.form_submit_button("Submit")
 
     if submitted:
@@ -170,16 +211,15 @@ def fetch_and_select_snippet(
     endpoints such as get, delete, toggle_favourite and tags
     """
 
-    list_endpoint_url = urls.get("list_snippet")
-    snippets = list_snippets(list_endpoint_url)
-    if "detail" in snippets.json():
-        st.error(f"❌ {snippets.json()['detail']}")
-    else:
-        snippet_ids = [snippet.get("id") for snippet in snippets.json()]
-        if action.lower() != "tag":
-            submitted, snippet = display_snippets(snippet_ids, action=action)
-            return submitted, snippet
-        return snippet_ids
+    snippets = cached_list_snippets(st.session_state.snippets_version, url)
+    if "detail" in snippets:
+        st.error(f"❌ {snippets['detail']}")
+        return
+    snippet_ids = list(map(itemgetter("id"), snippets))
+    if action.lower() != "tag":
+        submitted, snippet = display_snippets(snippet_ids, action=action)
+        return submitted, snippet
+    return snippet_ids
 
 
 if "view_id" not in st.session_state:
@@ -190,68 +230,106 @@ if "redirect_to_list" not in st.session_state:
     st.session_state.redirect_to_list = False
 if "menu_key" not in st.session_state:
     st.session_state.menu_key = 0
-
-view_to_index = {
-    "list": 0,
-    "add": 1,
-    "get": 2,
-    "search": 3,
-    "delete": 4,
-    "favourite": 5,
-    "tag": 6,
-}
+if "snippets_version" not in st.session_state:
+    st.session_state.snippets_version = 0
 
 if st.session_state.redirect_to_list:
     st.session_state.current_view = "list"
     st.session_state.redirect_to_list = False
     st.session_state.menu_key += 1
 
-with st.sidebar:
-    st.title("Snipster")
-    menu = st.radio(
-        "Navigation",
-        [
-            "List Snippets",
-            "Add Snippets",
-            "Get Snippet",
-            "Search Snippets",
-            "Delete Snippet",
-            "Toggle Favourite",
-            "Tag Snippets",
-        ],
-        key=f"menu_{st.session_state.menu_key}",
-        index=view_to_index.get(st.session_state.current_view, "list"),
-    )
+MENU_TO_VIEW = {
+    "List Snippets": "list",
+    "Add Snippets": "add",
+    "Get Snippet": "get",
+    "Search Snippets": "search",
+    "Delete Snippet": "delete",
+    "Toggle Favourite": "favourite",
+    "Tag Snippets": "tag",
+}
+MENU_LABELS = tuple(MENU_TO_VIEW)
+
+
+def render_sidebar() -> str:
+    """
+    Render the navigation sidebar and return the selected menu label.
+
+    The radio drives which view the whole script renders, so it is kept
+    out of a fragment: a fragment-scoped change would not switch views
+    """
+    with st.sidebar:
+        st.title("Snipster")
+        return st.radio(
+            "Navigation",
+            MENU_LABELS,
+            key=f"menu_{st.session_state.menu_key}",
+            index=view_to_index.get(st.session_state.current_view, "list"),
+        )
+
+
+menu = render_sidebar()
 
 
 def set_session_states():
     """Set session state values to their respective endpoints"""
     if not st.session_state.redirect_to_list:
-        if menu == "List Snippets":
-            st.session_state.current_view = "list"
-        elif menu == "Add Snippets":
-            st.session_state.current_view = "add"
-        elif menu == "Get Snippet":
-            st.session_state.current_view = "get"
-        elif menu == "Search Snippets":
-            st.session_state.current_view = "search"
-        elif menu == "Delete Snippet":
-            st.session_state.current_view = "delete"
-        elif menu == "Toggle Favourite":
-            st.session_state.current_view = "favourite"
-        else:
-            st.session_state.current_view = "tag"
+        st.session_state.current_view = MENU_TO_VIEW[menu]
+
+
+@st.cache_resource
+def get_client() -> httpx.Client:
+    """Shared HTTP client so every request reuses pooled keep-alive connections"""
+    client = httpx.Client(
+        base_url=API_URL,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        timeout=5.0,
+    )
+    atexit.register(client.close)
+    return client
+
+
+def parse_json(response: Response) -> list[dict] | dict:
+    """Decode a response body with orjson"""
+    return orjson.loads(response.content)
 
 
 def list_snippets(url: str) -> Response:
     """List snippets from the endpoint"""
-    response = httpx.get(url)
+    response = get_client().get(url)
     return response
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_list_snippets(version: int, url: str) -> list[dict] | dict:
+    """
+    Decoded snippet list, cached per data version so that widget
+    reruns reuse it and only mutations trigger a fresh fetch
+    """
+    snippets = parse_json(list_snippets(url))
+    if isinstance(snippets, list):
+        for snippet in snippets:
+            snippet["created_date"] = snippet["created_at"][:10]
+            snippet["updated_date"] = snippet["updated_at"][:10]
+    return snippets
+
+
+def bump_snippets_version(response: Response) -> None:
+    """
+    Invalidate the cached snippet list after a successful mutation.
+
+    The version bump makes this session's next read miss the cache; clearing
+    the process-wide cache stops other sessions from reading the stale list
+    until its TTL expires
+    """
+    if response.is_success:
+        st.session_state.snippets_version += 1
+        cached_list_snippets.clear()
+
+
 def create_snippet(url: str, snippet: dict[str, str]) -> Response:
     """Create Snippet"""
-    response = httpx.post(url, json=snippet)
+    response = get_client().post(url, json=snippet)
+    bump_snippets_version(response)
     return response
 
 
@@ -260,20 +338,18 @@ def get_snippet(url: str, snippet_id: int) -> Response:
 
     url = url.format(snippet_id=snippet_id)
     logger.info(f"url {url}")
-    response = httpx.get(url)
+    response = get_client().get(url)
     return response
 
 
 def search_snippet(url: str, term: str, language: str | None = None) -> Response:
     """Search snippet"""
 
+    params = {"term": term}
     if language:
-        url = f"{url}&language={language}"
-        url = url.format(term=term, language=language)
-    else:
-        url = url.format(term=term)
-    logger.info(url)
-    response = httpx.get(url)
+        params["language"] = language
+    logger.info(f"{url} {params}")
+    response = get_client().get(url, params=params)
     return response
 
 
@@ -281,7 +357,8 @@ def delete_snippet(url: str, snippet_id: int) -> Response:
     """Delete Snippet"""
 
     url = url.format(snippet_id=snippet_id)
-    response = httpx.delete(url)
+    response = get_client().delete(url)
+    bump_snippets_version(response)
     return response
 
 
@@ -289,7 +366,8 @@ def toggle_snippet(url: str, snippet_id: int) -> Response:
     """Toggle favourite Snippet"""
 
     url = url.format(snippet_id=snippet_id)
-    response = httpx.post(url)
+    response = get_client().post(url)
+    bump_snippets_version(response)
     return response
 
 
@@ -298,36 +376,35 @@ def tag_snippets(
 ) -> Response:
     """Tag Snippets"""
 
-    input_tags = ""
-    for tag in tags:
-        input_tags += f"&tags={tag.strip()}"
-    url = url.format(snippet_id=snippet_id, tags=input_tags, remove=remove, sort=sort)
+    query = urlencode(
+        [("tags", tag.strip()) for tag in tags] + [("remove", remove), ("sort", sort)]
+    )
+    url = f"{url.format(snippet_id=snippet_id)}?{query}"
     logger.info(url)
-    response = httpx.post(url)
+    response = get_client().post(url)
+    bump_snippets_version(response)
     return response
 
 
 set_session_states()
 
-urls = {
-    "list_snippet": f"{API_URL}/snippets/v1/list/",
-    "add_snippet": f"{API_URL}/snippets/v1/",
-    "get_snippet": API_URL + "/snippets/v1/{snippet_id}",
-    "search_snippet": API_URL + "/snippets/v1/search/?term={term}",
-    "delete_snippet": API_URL + "/snippets/v1/{snippet_id}",
-    "toggle_favourite": API_URL + "/snippets/v1/{snippet_id}/favourite",
-    "tag_snippets": API_URL
-    + "/snippets/v1/{snippet_id}/tags?={tags}&remove={remove}&sort={sort}",
-}
 
-if st.session_state.current_view == "list":
+@st.fragment
+def view_list() -> None:
+    """List all snippets"""
     list_endpoint_url = urls.get("list_snippet")
-    snippets = list_snippets(list_endpoint_url)
-    if "detail" in snippets.json():
-        st.error(f"❌ {snippets.json()['detail']}")
+    snippets = cached_list_snippets(
+        st.session_state.snippets_version, list_endpoint_url
+    )
+    if "detail" in snippets:
+        st.error(f"❌ {snippets['detail']}")
     else:
-        display_list_snippets(snippets.json())
-elif st.session_state.current_view == "add":
+        display_list_snippets(snippets)
+
+
+@st.fragment
+def view_add() -> None:
+    """Create a snippet from the form"""
     add_endpoint_url = urls.get("add_snippet")
     submitted, snippet = display_create_snippet_form()
 
@@ -341,12 +418,17 @@ elif st.session_state.current_view == "add":
             logger.error(" Duplicate snippet found")
             st.error(" Duplicate snippet found")
         elif response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT:
-            logger.error(f" Model validation error {response.json()['detail']}")
-            st.error(f"❌ Model validation error: {response.json()['detail']}")
+            detail = parse_json(response)["detail"]
+            logger.error(f" Model validation error {detail}")
+            st.error(f"❌ Model validation error: {detail}")
         else:
             logger.error(" Repository error")
             st.error("❌ Repository error")
-elif st.session_state.current_view == "get":
+
+
+@st.fragment
+def view_get() -> None:
+    """Fetch a single snippet"""
     get_endpoint_url = urls.get("get_snippet")
 
     list_endpoint_url = urls.get("list_snippet")
@@ -355,7 +437,7 @@ elif st.session_state.current_view == "get":
     if submitted:
         response = get_snippet(get_endpoint_url, snippet.get("snippet_id"))
         st.subheader(f"Snippet details for snippet '{snippet.get("snippet_id")}'")
-        create_streamlit_expander(response.json())
+        create_streamlit_expander(parse_json(response))
 
         if response.status_code == status.HTTP_200_OK:
             logger.info(f"Succesfully fetched snippet '{snippet.get("snippet_id")}'")
@@ -365,7 +447,11 @@ elif st.session_state.current_view == "get":
         else:
             logger.error(" Repository error")
             st.error("❌ Repository error")
-elif st.session_state.current_view == "search":
+
+
+@st.fragment
+def view_search() -> None:
+    """Search snippets by term and language"""
     search_endpoint_url = urls.get("search_snippet")
 
     submitted, params = display_search_snippet()
@@ -373,9 +459,10 @@ elif st.session_state.current_view == "search":
         response = search_snippet(search_endpoint_url, **params)
         st.subheader("Search results:")
         if response.status_code == status.HTTP_200_OK:
-            logger.info(f"Search returned {len(response.json())} snippets")
-            st.success(f"✅ Search returned {len(response.json())} snippets")
-            for snippet in response.json():
+            results = parse_json(response)
+            logger.info(f"Search returned {len(results)} snippets")
+            st.success(f"✅ Search returned {len(results)} snippets")
+            for snippet in results:
                 create_streamlit_expander(snippet)
         elif response.status_code == status.HTTP_404_NOT_FOUND:
             logger.error("Search returned no snippets")
@@ -383,7 +470,11 @@ elif st.session_state.current_view == "search":
         else:
             logger.error(" Repository error")
             st.error("❌ Repository error")
-elif st.session_state.current_view == "delete":
+
+
+@st.fragment
+def view_delete() -> None:
+    """Delete a snippet"""
     delete_endpoint_url = urls.get("delete_snippet")
 
     list_endpoint_url = urls.get("list_snippet")
@@ -407,7 +498,10 @@ elif st.session_state.current_view == "delete":
             logger.error(" Repository error")
             st.error("❌ Repository error")
 
-elif st.session_state.current_view == "favourite":
+
+@st.fragment
+def view_favourite() -> None:
+    """Toggle a snippet's favourite flag"""
     toggle_favourite_endpoint_url = urls.get("toggle_favourite")
 
     list_endpoint_url = urls.get("list_snippet")
@@ -418,17 +512,21 @@ elif st.session_state.current_view == "favourite":
             toggle_favourite_endpoint_url, snippet.get("snippet_id")
         )
         if response.status_code == status.HTTP_200_OK:
-            logger.info(f"{response.json()['message']}")
-            st.success(f"✅ {response.json()['message']}")
-            response = get_snippet(urls.get("get_snippet"), snippet.get("snippet_id"))
-            create_streamlit_expander(response.json())
+            data = parse_json(response)
+            logger.info(f"{data['message']}")
+            st.success(f"✅ {data['message']}")
+            create_streamlit_expander(data["snippet"])
         elif response.status_code == status.HTTP_404_NOT_FOUND:
             logger.error(f"No snippet found for snippet '{snippet.get("snippet_id")}'")
             st.error(f"❌ No snippet found for snippet '{snippet.get("snippet_id")}'")
         else:
             logger.error(" Repository error")
             st.error("❌ Repository error")
-elif st.session_state.current_view == "tag":
+
+
+@st.fragment
+def view_tag() -> None:
+    """Add or remove snippet tags"""
     tag_snippets_endpoint_url = urls.get("tag_snippets")
 
     list_endpoint_url = urls.get("list_snippet")
@@ -446,10 +544,10 @@ elif st.session_state.current_view == "tag":
         st.subheader(f"Snippet details for '{tags.get("snippet_id")}'")
 
         if response.status_code == status.HTTP_200_OK:
-            logger.info(f"{response.json()['message']}")
-            st.success(f"✅ {response.json()['message']}")
-            response = get_snippet(urls.get("get_snippet"), tags.get("snippet_id"))
-            create_streamlit_expander(response.json())
+            data = parse_json(response)
+            logger.info(f"{data['message']}")
+            st.success(f"✅ {data['message']}")
+            create_streamlit_expander(data["snippet"])
         elif response.status_code == status.HTTP_404_NOT_FOUND:
             logger.error(f"No snippet found for snippet '{tags.get("snippet_id")}'")
             st.error(f"❌ No snippet found for snippet '{tags.get("snippet_id")}'")
@@ -458,6 +556,19 @@ elif st.session_state.current_view == "tag":
             st.error("❌ Repository error")
 
 
+VIEWS = {
+    "list": view_list,
+    "add": view_add,
+    "get": view_get,
+    "search": view_search,
+    "delete": view_delete,
+    "favourite": view_favourite,
+    "tag": view_tag,
+}
+
+VIEWS[st.session_state.current_view]()
+
+
 def main():
     """Entry point for launching Streamlit app"""
     import sys
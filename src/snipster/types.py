@@ -1,4 +1,5 @@
 from enum import Enum
+from types import MappingProxyType
 
 
 class Language(str, Enum):
@@ -11,3 +12,18 @@ class Language(str, Enum):
     PYTHON = "Python"
     JAVASCRIPT = "JavaScript"
     TYPESCRIPT = "TypeScript"
+
+    @classmethod
+    def lookup(cls, name: str) -> "Language | None":
+        """Resolve a language name case-insensitively.
+
+        Args:
+            name: Language name in any casing, e.g. "python"
+
+        Returns:
+            The matching member, or None if the language is not supported
+        """
+        return _LANGUAGES_BY_NAME.get(name.lower())
+
+
+_LANGUAGES_BY_NAME = MappingProxyType({lang.value.lower(): lang for lang in Language})
@@ -1,3 +1,5 @@
+from uuid import uuid4
+
 import pytest
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
@@ -7,35 +9,42 @@ from snipster.api import routes
 from snipster.api.dependencies import get_repo
 from snipster.exceptions import MultipleSnippetsFoundError, RepositoryError
 from snipster.repositories.backend import create_repository
+from snipster.repositories.repository import SnippetRepository
 
+app = FastAPI()
+app.include_router(routes.router)
 
-@pytest.fixture(scope="function")
-def sql_repo(mocker, tmp_path):
-    """Create SQLModelRepository"""
+SNIPPET_FIELDS = {
+    "title": "first",
+    "code": "code1",
+    "description": "description",
+    "tags": "tag1,tag2",
+}
+
+
+def make_snippet(**overrides) -> Snippet:
+    """Build a snippet from the shared test fields with selected overrides"""
+    return Snippet(**(SNIPPET_FIELDS | overrides))
 
-    db_file = tmp_path / "test.db"
 
-    def mock_config(key, default=None):
-        config_values = {
-            "DATABASE_URL": f"sqlite:///{db_file}",  # "sqlite:///:memory:?check_same_thread=False",
-            # "DATABASE_URL": "sqlite:///file:testdb?mode=memory&cache=shared&uri=true",
-            "REPOSITORY_TYPE": "sql",
-        }
-        return config_values.get(key, default)
+@pytest.fixture(scope="session")
+def sql_repo():
+    """Create one SQLModelRepository backed by a shared-cache in-memory database"""
 
-    mocker.patch("snipster.repositories.backend.config", side_effect=mock_config)
-    repo = create_repository("sql")
+    db_url = f"sqlite:///file:test_{uuid4().hex}?mode=memory&cache=shared&uri=true"
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("DATABASE_URL", db_url)
+        monkeypatch.setenv("REPOSITORY_TYPE", "sql")
+        repo = create_repository()
     yield repo
     repo.db_manager.engine.dispose()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def client(sql_repo):
     """Instantiate TestClient"""
 
-    app = FastAPI()
-    app.include_router(routes.router)
-
     app.dependency_overrides[get_repo] = lambda: sql_repo
 
     with TestClient(app) as test_client:
@@ -44,17 +53,31 @@ def client(sql_repo):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="function")
+def mock_repo(client, sql_repo, mocker):
+    """Serve an autospecced repository mock for tests that only exercise error paths"""
+
+    repo = mocker.create_autospec(SnippetRepository, instance=True)
+    app.dependency_overrides[get_repo] = lambda: repo
+    yield repo
+    app.dependency_overrides[get_repo] = lambda: sql_repo
+
+
+@pytest.fixture(autouse=True)
+def clean_snippets(sql_repo):
+    """Empty the snippet table after each test so ids restart at 1"""
+    yield
+    with sql_repo.db_manager.engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM snippet")
+    sql_repo._invalidate_list_cache()
+
+
 def test_model_validation_error(client):
     """Test Model validation error"""
 
     response = client.post(
         "/snippets/v1/",
-        json={
-            "title": "fi",
-            "code": "code1",
-            "description": "description",
-            "tags": "tag1,tag2",
-        },
+        json=SNIPPET_FIELDS | {"title": "fi"},
     )
 
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
@@ -68,12 +91,7 @@ def test_create_snippet(client, sql_repo):
 
     response = client.post(
         "/snippets/v1/",
-        json={
-            "title": "first",
-            "code": "code1",
-            "description": "description",
-            "tags": "tag1,tag2",
-        },
+        json=SNIPPET_FIELDS,
     )
     assert response.status_code == status.HTTP_201_CREATED
     data = response.json()
@@ -83,19 +101,12 @@ def test_create_snippet(client, sql_repo):
 def test_create_duplicate_snippet(client, sql_repo):
     """Create duplicate snippet"""
 
-    snippet = Snippet(
-        title="first", code="code1", description="description", tags="tag1,tag2"
-    )
+    snippet = make_snippet()
     sql_repo.add(snippet)
 
     response = client.post(
         "/snippets/v1/",
-        json={
-            "title": "first",
-            "code": "code1",
-            "description": "description",
-            "tags": "tag1,tag2",
-        },
+        json=SNIPPET_FIELDS,
     )
 
     assert response.status_code == status.HTTP_409_CONFLICT
@@ -106,14 +117,9 @@ def test_create_duplicate_snippet(client, sql_repo):
 def test_list_snippets(client, sql_repo):
     """List snippets endpoint"""
 
-    snippet1 = Snippet(
-        title="first", code="code1", description="description", tags="tag1,tag2"
-    )
-    snippet2 = Snippet(
-        title="second", code="code2", description="description", tags="tag1,tag2"
-    )
-    sql_repo.add(snippet1)
-    sql_repo.add(snippet2)
+    snippet1 = make_snippet()
+    snippet2 = make_snippet(title="second", code="code2")
+    sql_repo.bulk_add([snippet1, snippet2])
 
     response = client.get("/snippets/v1/list/")
     data = response.json()
@@ -135,9 +141,7 @@ def test_list_snippets_empty(client, sql_repo):
 def test_get_snippet(client, sql_repo):
     """Fetch single snippet"""
 
-    snippet = Snippet(
-        title="first", code="code1", description="description", tags="tag1,tag2"
-    )
+    snippet = make_snippet()
     sql_repo.add(snippet)
 
     response = client.get("/snippets/v1/1")
@@ -147,22 +151,10 @@ def test_get_snippet(client, sql_repo):
     assert data["title"] == "first"
 
 
-def test_get_snippet_non_existent(client, sql_repo):
-    """Fetch non-existent snippet"""
-
-    response = client.get("/snippets/v1/999")
-
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    data = response.json()
-    assert data["detail"] == "Snippet '999' not found"
-
-
 def test_delete_snippet(client, sql_repo):
     """Delete snippet"""
 
-    snippet = Snippet(
-        title="first", code="code1", description="description", tags="tag1,tag2"
-    )
+    snippet = make_snippet()
     sql_repo.add(snippet)
 
     response = client.delete("/snippets/v1/1")
@@ -172,21 +164,10 @@ def test_delete_snippet(client, sql_repo):
     assert data["message"] == "Snippet '1' deleted successfully"
 
 
-def test_delete_snippet_non_existent(client, sql_repo):
-    """Delete non-existent snippet"""
-
-    response = client.delete("/snippets/v1/999")
-
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    data = response.json()
-    assert data["detail"] == "Snippet '999' not found"
-
-
-def test_delete_snippets_multiplesnippetsfound_error(client, mocker, sql_repo):
+def test_delete_snippets_multiplesnippetsfound_error(client, mock_repo):
     """Test for MultipleSnippetsFoundError during delete"""
 
-    mock_method = mocker.patch.object(sql_repo, "delete")
-    mock_method.side_effect = MultipleSnippetsFoundError(
+    mock_repo.delete.side_effect = MultipleSnippetsFoundError(
         "Multiple snippets found error"
     )
 
@@ -199,9 +180,7 @@ def test_delete_snippets_multiplesnippetsfound_error(client, mocker, sql_repo):
 def test_search_snippets_by_term(client, sql_repo):
     """Search for term in snippets"""
 
-    snippet = Snippet(
-        title="first", code="code1", description="description", tags="tag1,tag2"
-    )
+    snippet = make_snippet()
     sql_repo.add(snippet)
 
     response = client.get("/snippets/v1/search/?term=code")
@@ -215,22 +194,10 @@ def test_search_snippets_by_term(client, sql_repo):
 def test_search_snippets_by_language(client, sql_repo):
     """Search for term in snippets by specific language"""
 
-    snippet1 = Snippet(
-        title="first", code="code1", description="description", tags="tag1,tag2"
-    )
-    snippet2 = Snippet(
-        title="second", code="code2", description="description", tags="tag1,tag2"
-    )
-    snippet3 = Snippet(
-        title="first",
-        code="code1",
-        description="description",
-        tags="tag1,tag2",
-        language=Language.JAVASCRIPT,
-    )
-    sql_repo.add(snippet1)
-    sql_repo.add(snippet2)
-    sql_repo.add(snippet3)
+    snippet1 = make_snippet()
+    snippet2 = make_snippet(title="second", code="code2")
+    snippet3 = make_snippet(language=Language.JAVASCRIPT)
+    sql_repo.bulk_add([snippet1, snippet2, snippet3])
 
     response = client.get("/snippets/v1/search/?term=code&language=python")
 
@@ -253,9 +220,7 @@ def test_search_snippets_non_existent(client):
 def test_toggle_favourite_snippet(client, sql_repo):
     """Toggle favourite snippet"""
 
-    snippet1 = Snippet(
-        title="first", code="code1", description="description", tags="tag1,tag2"
-    )
+    snippet1 = make_snippet()
     sql_repo.add(snippet1)
     snippet = sql_repo.get(1)
 
@@ -266,22 +231,13 @@ def test_toggle_favourite_snippet(client, sql_repo):
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert data["message"] == "Snippet '1' is Favourited"
-
-
-def test_toggle_favourite_snippet_non_existent(client):
-    """Search for non-existent snippet"""
-
-    response = client.post("/snippets/v1/999/favourite")
-
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    data = response.json()
-    assert data["detail"] == "Snippet '999' not found"
+    assert data["snippet"]["favorite"] is True
 
 
 def test_tag_snippets(client, sql_repo):
     """Tag snippets"""
 
-    snippet1 = Snippet(title="first", code="code1", description="description")
+    snippet1 = make_snippet(tags=None)
     sql_repo.add(snippet1)
 
     response = client.post("/snippets/v1/1/tags?tags=tag1&tags=tag2")
@@ -289,14 +245,13 @@ def test_tag_snippets(client, sql_repo):
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert data["message"] == "Successfully tagged snippet '1'"
+    assert data["snippet"]["tags"] == "tag1, tag2"
 
 
 def test_tag_snippets_removal(client, sql_repo):
     """Tag snippets for removal"""
 
-    snippet1 = Snippet(
-        title="first", code="code1", description="description", tags="tag1, tag2, tag3"
-    )
+    snippet1 = make_snippet(tags="tag1, tag2, tag3")
     sql_repo.add(snippet1)
 
     response = client.post("/snippets/v1/1/tags?tags=tag2&remove=True")
@@ -309,16 +264,42 @@ def test_tag_snippets_removal(client, sql_repo):
     )
 
 
-def test_tag_snippets_non_existstent(client):
-    """Tag non-existent snippets"""
+@pytest.mark.parametrize(
+    "method,path",
+    [
+        ("GET", "/snippets/v1/999"),
+        ("DELETE", "/snippets/v1/999"),
+        ("POST", "/snippets/v1/999/favourite"),
+        ("POST", "/snippets/v1/999/tags?tags=tag2&remove=True"),
+    ],
+    ids=["get", "delete", "toggle_favourite", "tags"],
+)
+def test_routes_snippet_non_existent(client, method, path):
+    """Test that routes addressing a missing snippet return 404"""
 
-    response = client.post("/snippets/v1/999/tags?tags=tag2&remove=True")
+    response = client.request(method, path)
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
     data = response.json()
     assert data["detail"] == "Snippet '999' not found"
 
 
+@pytest.mark.parametrize(
+    "path",
+    ["/snippets/v1/1/favourite", "/snippets/v1/1/tags?tags=tag1"],
+    ids=["toggle_favourite", "tags"],
+)
+def test_routes_snippet_deleted_after_update(client, mock_repo, path):
+    """Test that a snippet deleted before the read-back returns 404, not 500"""
+
+    mock_repo.get.return_value = None
+
+    response = client.post(path)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "Snippet '1' not found"
+
+
 @pytest.mark.parametrize(
     "method,path,json_data,repo_method",
     [
@@ -333,12 +314,11 @@ def test_tag_snippets_non_existstent(client):
     ids=["create", "list", "get", "delete", "search", "toggle_favourite", "tags"],
 )
 def test_routes_operational_errors_logged(
-    client, sql_repo, mocker, method, path, json_data, repo_method
+    client, mock_repo, method, path, json_data, repo_method
 ):
     """Test that all routes handle RepositoryError and return 500"""
 
-    mock_method = mocker.patch.object(sql_repo, repo_method)
-    mock_method.side_effect = RepositoryError("Database error")
+    getattr(mock_repo, repo_method).side_effect = RepositoryError("Database error")
 
     if method == "POST":
         response = client.post(path, json=json_data) if json_data else client.post(path)
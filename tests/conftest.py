@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(scope="function")
+def mock_session(mocker):
+    """Patch Session and return the mock every `with` block in the manager receives"""
+    return mocker.patch(
+        "snipster.database_manager.Session"
+    ).return_value.__enter__.return_value
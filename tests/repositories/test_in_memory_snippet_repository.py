@@ -24,7 +24,6 @@ def snippet_factory(repo):
 def test_add_and_get_snippet(repo, snippet_factory):
     """Test adding a snippet and retrieving it"""
     snippet = snippet_factory()
-    repo.add(snippet)
 
     retrieved = repo.get(1)
     assert retrieved is not None
@@ -143,9 +142,7 @@ def test_search_term_in_description(repo):
 
 def test_search_term_not_found_error(repo, snippet_factory):
     """Test ValueError due to term not found"""
-    snippet1 = snippet_factory()
-
-    repo.add(snippet1)
+    snippet_factory()
 
     with pytest.raises(ValueError):
         repo.search("missing_term")
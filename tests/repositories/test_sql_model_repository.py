@@ -1,7 +1,9 @@
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.exc import (
     OperationalError,
 )
+from sqlalchemy.pool import StaticPool
 
 from snipster import Language, Snippet
 from snipster.exceptions import (
@@ -11,20 +13,40 @@ from snipster.exceptions import (
 )
 from snipster.repositories.sql_model_repository import SQLModelRepository
 
+DEFAULT_SNIPPET = {"title": "test code", "code": "print('hello test')"}
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """In-memory database with the schema and full-text index built once per session"""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"autocommit": False, "check_same_thread": False},
+    )
+    with engine.connect() as connection:
+        SQLModelRepository(connection=connection)
+        connection.commit()
+    yield engine
+    engine.dispose()
+
 
 @pytest.fixture
-def repo():
-    repository = SQLModelRepository(db_url="sqlite:///:memory:")
-    yield repository
-    repository.db_manager.engine.dispose()
+def repo(engine):
+    """Repository whose writes are rolled back after each test"""
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield SQLModelRepository(connection=connection)
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
 def snippet_factory(repo):
     """Factory for creating test snippets"""
 
-    def _create_snippet(title="test code", code="print('hello test')"):
-        snippet = Snippet(title=title, code=code)
+    def _create_snippet(**overrides):
+        snippet = Snippet(**(DEFAULT_SNIPPET | overrides))
         repo.add(snippet)
         return snippet
 
@@ -47,8 +69,7 @@ def test_add_multiple_snippets(repo):
     snippet1 = Snippet(title="first", code="code1")
     snippet2 = Snippet(title="second", code="code2")
 
-    repo.add(snippet1)
-    repo.add(snippet2)
+    assert repo.bulk_add([snippet1, snippet2]) == 2
 
     all_snippets = repo.list()
     assert len(all_snippets) == 2
@@ -60,14 +81,26 @@ def test_add_multiple_snippets(repo):
 def test_add_duplicate_snippet_error(repo, snippet_factory):
     """Test that duplicate snippets (same title+language) are rejected and an error is thrown"""
 
+    snippet_factory()
     with pytest.raises(DuplicateSnippetError):
-        for _ in range(2):
-            snippet_factory()
+        snippet_factory()
     all_snippets = repo.list()
     assert len(all_snippets) == 1
     assert all_snippets[0].title == "test code"
 
 
+def test_bulk_add_skips_duplicates(repo):
+    """Test that bulk_add inserts in one call and skips duplicate snippets"""
+    snippets = [
+        Snippet(title="first", code="code1"),
+        Snippet(title="first", code="code1"),
+        Snippet(title="second", code="code2"),
+    ]
+
+    assert repo.bulk_add(snippets) == 2
+    assert {s.title for s in repo.list()} == {"first", "second"}
+
+
 def test_list_empty_repo(repo):
     """Test listing snippets from empty repository"""
     assert len(repo.list()) == 0
@@ -79,8 +112,7 @@ def test_list_returns_all_snippets(repo):
     snippet1 = Snippet(title="first", code="code1")
     snippet2 = Snippet(title="second", code="code2")
 
-    repo.add(snippet1)
-    repo.add(snippet2)
+    repo.bulk_add([snippet1, snippet2])
 
     all_snippets = repo.list()
     assert len(all_snippets) == 2
@@ -89,6 +121,84 @@ def test_list_returns_all_snippets(repo):
     assert titles == {"first", "second"}
 
 
+def test_list_is_cached_until_write(repo, mocker):
+    """Test that list is served from cache and refreshed after a write"""
+    spy = mocker.spy(repo.db_manager, "stream_all")
+    repo.add(Snippet(title="first", code="code1"))
+
+    assert len(repo.list()) == 1
+    assert len(repo.list()) == 1
+    assert spy.call_count == 1
+
+    repo.toggle_favourite(1)
+    assert repo.list()[0].favorite is True
+    assert spy.call_count == 2
+
+    repo.tags(1, "tag1")
+    assert repo.list()[0].tags == "tag1"
+
+    repo.delete(1)
+    assert repo.list() == []
+    assert spy.call_count == 4
+
+
+def test_list_during_write_does_not_leave_stale_cache(repo, mocker):
+    """Test that a list() racing a write cannot cache the pre-write rows"""
+    insert_record = repo.db_manager.insert_record
+
+    def list_then_insert(model, record):
+        repo.list()
+        return insert_record(model, record)
+
+    mocker.patch.object(repo.db_manager, "insert_record", side_effect=list_then_insert)
+
+    repo.add(Snippet(**DEFAULT_SNIPPET))
+
+    assert len(repo.list()) == 1
+
+
+def test_list_not_cached_when_invalidated_during_read(repo, mocker):
+    """Test that rows read while a write commits are not cached as fresh"""
+    iter_batches = repo.iter_batches
+
+    def read_with_concurrent_write(*args, **kwargs):
+        yield from iter_batches(*args, **kwargs)
+        repo._invalidate_list_cache()
+
+    spy = mocker.patch.object(
+        repo, "iter_batches", side_effect=read_with_concurrent_write
+    )
+
+    repo.list()
+    repo.list()
+
+    assert spy.call_count == 2
+
+
+def test_list_cache_expires_after_ttl(repo, mocker):
+    """Test that a stale list cache is refreshed"""
+    spy = mocker.spy(repo.db_manager, "stream_all")
+    repo.cache_ttl = 0
+    mocker.patch(
+        "snipster.repositories.sql_model_repository.time.monotonic",
+        side_effect=[1.0, 2.0],
+    )
+
+    repo.list()
+    repo.list()
+
+    assert spy.call_count == 2
+
+
+def test_iter_batches(repo):
+    """Test that snippets are streamed in batches"""
+    repo.bulk_add([Snippet(title=f"title{i}", code="code") for i in range(3)])
+
+    batches = list(repo.iter_batches(batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 1]
+
+
 def test_get_non_existent_snippet(repo):
     """Test that getting non-existent snippet returns None"""
     assert repo.get(999) is None
@@ -118,8 +228,7 @@ def test_delete_removes_from_list(repo):
     snippet1 = Snippet(title="first", code="code1")
     snippet2 = Snippet(title="second", code="code2")
 
-    repo.add(snippet1)
-    repo.add(snippet2)
+    repo.bulk_add([snippet1, snippet2])
 
     assert len(repo.list()) == 2
 
@@ -168,9 +277,7 @@ def test_search_python_term_in_code(repo):
     snippet2 = Snippet(title="second_title", code="code2")
     snippet3 = Snippet(title="third_itle", code="code3", language=Language.JAVASCRIPT)
 
-    repo.add(snippet1)
-    repo.add(snippet2)
-    repo.add(snippet3)
+    repo.bulk_add([snippet1, snippet2, snippet3])
     all_snippets = repo.search("code", language="python")
     codes = {snippet.code for snippet in all_snippets}
 
@@ -184,9 +291,7 @@ def test_search_term_in_description(repo):
     snippet2 = Snippet(title="second_title", code="code2", description="Describe code2")
     snippet3 = Snippet(title="third_itle", code="code3", language=Language.JAVASCRIPT)
 
-    repo.add(snippet1)
-    repo.add(snippet2)
-    repo.add(snippet3)
+    repo.bulk_add([snippet1, snippet2, snippet3])
     all_snippets = repo.search("code1")
 
     assert len(all_snippets) == 1
@@ -195,9 +300,8 @@ def test_search_term_in_description(repo):
 
 def test_search_term_not_found(repo, snippet_factory):
     """Test search that returns no results"""
-    snippet1 = snippet_factory()
+    snippet_factory()
 
-    repo.add(snippet1)
     results = repo.search("search")
 
     assert len(results) == 0
@@ -207,58 +311,39 @@ def test_search_term_not_found(repo, snippet_factory):
 def test_search_term_found_but_lang_not_found(repo, mocker, snippet_factory):
     """Test search with valid term but non-matching language returns empty list"""
     mock_logger = mocker.patch("snipster.repositories.sql_model_repository.logger")
-    snippet1 = snippet_factory()
+    snippet_factory()
 
-    repo.add(snippet1)
     results = repo.search("test", language="TypeScript")
 
     assert len(results) == 0
     mock_logger.warning.assert_called_once()
 
 
-def test_search_wildcard_percent_doesnt_match_all(repo):
-    """Test that % is escaped and doesn't match everything"""
-    repo.add(Snippet(title="test1", code="code"))
-    repo.add(Snippet(title="test2", code="code"))
-    repo.add(Snippet(title="100%", code="code"))
-
-    results = repo.search("%")
-
-    assert len(results) == 1
-    assert results[0].title == "100%"
-
-
-def test_search_wildcard_underscore_doesnt_match_all(repo):
-    """Test that _ is escaped and doesn't match everything"""
-    repo.add(Snippet(title="test1", code="code"))
-    repo.add(Snippet(title="test2", code="code"))
-    repo.add(Snippet(title="test_var", code="code"))
+WILDCARD_TITLES = ("test1", "test2", "100%", "test_var", "C:\\Users", "normal")
 
-    results = repo.search("_")
-
-    assert len(results) == 1
-    assert results[0].title == "test_var"
-
-
-def test_search_backslash_escaping(repo):
-    """Test that backslashes are properly escaped"""
-    repo.add(Snippet(title="C:\\Users", code="code"))
-    repo.add(Snippet(title="normal", code="code"))
-
-    results = repo.search("C:\\")
-
-    assert len(results) == 1
-    assert "C:\\" in results[0].title
 
+@pytest.fixture
+def wildcard_repo(repo):
+    """Repository seeded with titles containing LIKE wildcards and backslashes"""
+    repo.bulk_add([Snippet(title=title, code="code") for title in WILDCARD_TITLES])
+    return repo
 
-def test_search_prevents_sql_injection_or_operator(repo, snippet_factory):
-    """Test that OR injection doesn't return all records"""
-    snippet1 = snippet_factory()
 
-    repo.add(snippet1)
-    results = repo.search("nonexistent' OR '1'='1")
+@pytest.mark.parametrize(
+    "pattern,expected_titles",
+    [
+        ("%", ["100%"]),
+        ("_", ["test_var"]),
+        ("C:\\", ["C:\\Users"]),
+        ("nonexistent' OR '1'='1", []),
+    ],
+    ids=["percent", "underscore", "backslash", "or_injection"],
+)
+def test_search_escapes_like_wildcards(wildcard_repo, pattern, expected_titles):
+    """Test that %, _, backslashes and quotes match literally instead of everything"""
+    results = wildcard_repo.search(pattern)
 
-    assert len(results) == 0
+    assert [snippet.title for snippet in results] == expected_titles
 
 
 def test_toggle_favourite(repo, snippet_factory):
@@ -344,21 +429,9 @@ def test_duplicate_tags(repo, snippet_factory):
     assert snippet.tags == "tag1, tag2"
 
 
-@pytest.mark.parametrize(
-    "error_scenarios",
-    [
-        "add",
-    ],
-)
-def test_sql_repo_operational_errors_logged(repo, mocker, error_scenarios):
-    """Test that all sql repo db operations log OperationalError properly"""
-    mock_session = mocker.patch("snipster.database_manager.Session")
-
-    snippet1 = Snippet(title="first", code="code1")
+def test_add_operational_error_raises_repository_error(repo, mock_session):
+    """Test that an OperationalError during add surfaces as RepositoryError"""
+    mock_session.commit.side_effect = OperationalError("Mock DB error", None, None)
 
-    if error_scenarios == "add":
-        mock_session.return_value.__enter__.return_value.commit.side_effect = (
-            OperationalError("Mock DB error", None, None)
-        )
-        with pytest.raises(RepositoryError):
-            repo.add(snippet1)
+    with pytest.raises(RepositoryError):
+        repo.add(Snippet(title="first", code="code1"))
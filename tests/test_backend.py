@@ -5,19 +5,24 @@ from snipster.repositories.in_memory_repository import InMemorySnippetRepository
 from snipster.repositories.json_repository import JSONSnippetRepository
 from snipster.repositories.sql_model_repository import SQLModelRepository
 
+SQL_CONFIG = {
+    "DATABASE_URL": "sqlite:///:memory:",
+    "REPOSITORY_TYPE": "sql",
+}
+
 
 @pytest.fixture
-def sql_repo(mocker):
-    """Create SQLModelRepository"""
+def sql_config(mocker):
+    """Serve the SQL backend settings from SQL_CONFIG"""
+    return mocker.patch(
+        "snipster.repositories.backend.config",
+        side_effect=lambda key, default=None: SQL_CONFIG.get(key, default),
+    )
 
-    def mock_config(key, default=None):
-        config_values = {
-            "DATABASE_URL": "sqlite:///:memory:",
-            "REPOSITORY_TYPE": "sql",
-        }
-        return config_values.get(key, default)
 
-    mocker.patch("snipster.repositories.backend.config", side_effect=mock_config)
+@pytest.fixture
+def sql_repo(sql_config):
+    """Create SQLModelRepository"""
     repo = create_repository("sql")
     yield repo
     repo.db_manager.engine.dispose()
@@ -51,16 +56,8 @@ def test_create_json_repository(mocker, tmp_path):
     assert repo.sub_dir == str(tmp_path)
 
 
-def test_repo_object_uses_default(mocker):
+def test_repo_object_uses_default(sql_config):
     """Test repo object uses default"""
-    mocker.patch(
-        "snipster.repositories.backend.config",
-        side_effect=lambda key, default=None: {
-            "REPOSITORY_TYPE": "sql",
-            "DATABASE_URL": "sqlite:///:memory:",
-        }.get(key, default),
-    )
-
     repo = create_repository()
 
     assert isinstance(repo, SQLModelRepository)
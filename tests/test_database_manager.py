@@ -1,124 +1,154 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, nullcontext
+
 import pytest
+from pydantic import ValidationError
+from sqlalchemy import create_engine, event
 from sqlalchemy.exc import (
     IntegrityError,
     MultipleResultsFound,
     NoResultFound,
     OperationalError,
 )
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Field, SQLModel
 
 from snipster import Language, Snippet
-from snipster.database_manager import DatabaseManager
+from snipster.database_manager import SCHEMA_CREATED, DatabaseManager
 from snipster.exceptions import (
     DuplicateSnippetError,
     RepositoryError,
     SnippetNotFoundError,
 )
 
+DUPLICATE_PAYLOAD_KEYS = (
+    "hello_world",
+    "hello_world",
+    "for_loop",
+    "for_loop",
+    "list_comprehension",
+    "dictionary",
+    "function",
+)
+
+
+class Note(SQLModel, table=True):
+    """Table without a unique constraint, so inserts never conflict"""
+
+    id: int | None = Field(default=None, primary_key=True)
+    body: str
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """
+    In-memory database whose tables are created once per test session.
+
+    The schema is built through a manager so the engine is recorded and the
+    per-test managers skip create_all.
+
+    StaticPool keeps the single in-memory connection alive for every checkout,
+    and `autocommit=False` puts sqlite3 in PEP 249 transaction mode so that
+    the SAVEPOINTs used for the per-test rollback behave correctly.
+    """
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"autocommit": False, "check_same_thread": False},
+    )
+    with engine.connect() as connection:
+        DatabaseManager(connection=connection)
+    yield engine
+    engine.dispose()
+
 
 @pytest.fixture(scope="function")
-def db_manager():
-    db_manager = DatabaseManager(db_url="sqlite:///:memory:")
-    yield db_manager
-    db_manager.engine.dispose()
+def db_manager(engine):
+    """Database manager whose writes are rolled back after each test"""
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield DatabaseManager(connection=connection)
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="module")
+def snippet_payloads():
+    """Snippet fields built once per module; fixtures create fresh instances"""
+    return {
+        "hello_world": {
+            "title": "Hello World",
+            "code": "print('Hello, World!')",
+            "description": "Basic Python hello world",
+            "language": Language.PYTHON,
+            "tags": "beginner, tutorial",
+        },
+        "for_loop": {
+            "title": "For Loop",
+            "code": "for i in range(10):\n    print(i)",
+            "language": Language.PYTHON,
+            "tags": "loops, basics",
+        },
+        "list_comprehension": {
+            "title": "List Comprehension",
+            "code": "squares = [x**2 for x in range(10)]",
+            "language": Language.PYTHON,
+            "tags": "list, comprehension",
+        },
+        "dictionary": {
+            "title": "Dictionary Example",
+            "code": "my_dict = {'key': 'value', 'number': 42}",
+            "language": Language.PYTHON,
+            "tags": "dictionary, basics",
+        },
+        "function": {
+            "title": "Function Definition",
+            "code": "def greet(name):\n    return f'Hello, {name}!'",
+            "language": Language.PYTHON,
+            "tags": "function, basics",
+        },
+    }
 
 
 @pytest.fixture(scope="function")
-def sample_snippet():
+def sample_snippet(snippet_payloads):
     """Factory for creating test snippets"""
-    return Snippet(
-        title="Hello World",
-        code="print('Hello, World!')",
-        description="Basic Python hello world",
-        language=Language.PYTHON,
-        tags="beginner, tutorial",
-    )
+    return Snippet(**snippet_payloads["hello_world"])
 
 
 @pytest.fixture(scope="function")
-def multiple_snippets():
+def multiple_snippets(snippet_payloads):
     """Factory for creating multiple test snippets"""
-    return [
-        Snippet(
-            title="Hello World",
-            code="print('Hello, World!')",
-            description="Basic Python hello world",
-            language=Language.PYTHON,
-            tags="beginner, tutorial",
-        ),
-        Snippet(
-            title="For Loop",
-            code="for i in range(10):\n    print(i)",
-            language=Language.PYTHON,
-            tags="loops, basics",
-        ),
-    ]
+    return [Snippet(**snippet_payloads[key]) for key in ("hello_world", "for_loop")]
 
 
 @pytest.fixture(scope="function")
-def multiple_snippets_with_duplicates():
+def multiple_snippets_with_duplicates(snippet_payloads):
     """Factory for creating multiple test snippets with duplicates"""
-    return [
-        Snippet(
-            title="Hello World",
-            code="print('Hello, World!')",
-            description="Basic Python hello world",
-            language=Language.PYTHON,
-            tags="beginner, tutorial",
-        ),
-        Snippet(
-            title="Hello World",
-            code="print('Hello, World!')",
-            description="Basic Python hello world",
-            language=Language.PYTHON,
-            tags="beginner, tutorial",
-        ),
-        Snippet(
-            title="For Loop",
-            code="for i in range(10):\n    print(i)",
-            language=Language.PYTHON,
-            tags="loops, basics",
-        ),
-        Snippet(
-            title="For Loop",
-            code="for i in range(10):\n    print(i)",
-            language=Language.PYTHON,
-            tags="loops, basics",
-        ),
-        Snippet(
-            title="List Comprehension",
-            code="squares = [x**2 for x in range(10)]",
-            language=Language.PYTHON,
-            tags="list, comprehension",
-        ),
-        Snippet(
-            title="Dictionary Example",
-            code="my_dict = {'key': 'value', 'number': 42}",
-            language=Language.PYTHON,
-            tags="dictionary, basics",
-        ),
-        Snippet(
-            title="Function Definition",
-            code="def greet(name):\n    return f'Hello, {name}!'",
-            language=Language.PYTHON,
-            tags="function, basics",
-        ),
-    ]
+    return [Snippet(**snippet_payloads[key]) for key in DUPLICATE_PAYLOAD_KEYS]
+
+
+@pytest.fixture(scope="function")
+def error_mocks(mocker, mock_session):
+    """Patch the module logger and the session it opens, returning both mocks"""
+    return mocker.patch("snipster.database_manager.logger"), mock_session
 
 
 class TestConstructorValidation:
     """Group all constructor-related tests"""
 
-    def test_uses_config_when_db_url_is_none(self, mocker):
+    def test_uses_config_when_db_url_is_none(self, mocker, tmp_path):
         """Test that DATABASE_URL is read from config when db_url=Non"""
+        db_url = f"sqlite:///{tmp_path / 'test_from_env.db'}"
         mock_config = mocker.patch("snipster.database_manager.config")
-        mock_config.return_value = "sqlite:///test_from_env.db"
+        mock_config.return_value = db_url
 
         manager = DatabaseManager()
 
         mock_config.assert_called_once_with(
             "DATABASE_URL", default="sqlite:///snippets.db"
         )
-        assert manager.db_url == "sqlite:///test_from_env.db"
+        assert manager.db_url == db_url
 
         manager.engine.dispose()
 
@@ -143,6 +173,84 @@ class TestConstructorValidation:
         with pytest.raises(ValueError, match="db_url cannot be empty"):
             DatabaseManager(db_url="  ")
 
+    def test_file_backed_sqlite_uses_wal(self, tmp_path):
+        """Test that file-backed SQLite connections are switched to WAL"""
+        manager = DatabaseManager(db_url=f"sqlite:///{tmp_path / 'wal.db'}")
+
+        with manager.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+
+        manager.engine.dispose()
+
+    def test_in_memory_sqlite_skips_wal(self):
+        """Test that in-memory SQLite keeps its default journal mode"""
+        manager = DatabaseManager(db_url="sqlite:///:memory:")
+
+        with manager.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "memory"
+
+        manager.engine.dispose()
+
+    def test_recreates_schema_when_file_database_is_replaced(self, tmp_path):
+        """Test that a new manager rebuilds tables after the file is removed"""
+        db_path = tmp_path / "schema.db"
+        first = DatabaseManager(db_url=f"sqlite:///{db_path}")
+        first.engine.dispose()
+        db_path.unlink()
+
+        second = DatabaseManager(db_url=f"sqlite:///{db_path}")
+
+        assert second.select_all(Snippet) == []
+        second.engine.dispose()
+
+    def test_schema_created_once_per_engine(self, engine, mocker):
+        """Test that managers sharing a committed engine skip create_all"""
+        create_all = mocker.spy(SQLModel.metadata, "create_all")
+
+        with engine.connect() as connection:
+            DatabaseManager(connection=connection)
+
+        create_all.assert_not_called()
+
+    def test_schema_in_open_transaction_is_not_recorded(self):
+        """Test that DDL which may still be rolled back is not trusted"""
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        with engine.connect() as connection, connection.begin():
+            DatabaseManager(connection=connection)
+
+        assert engine not in SCHEMA_CREATED
+        engine.dispose()
+
+    def test_shared_cache_memory_db_is_visible_across_threads(self, sample_snippet):
+        """Test that a URI in-memory database is shared by every thread"""
+        manager = DatabaseManager(
+            db_url="sqlite:///file:shared_test?mode=memory&cache=shared&uri=true"
+        )
+        manager.insert_record(Snippet, sample_snippet)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            snippets = pool.submit(manager.select_all, Snippet).result()
+
+        assert isinstance(manager.engine.pool, StaticPool)
+        assert [s.title for s in snippets] == ["Hello World"]
+        manager.engine.dispose()
+
+    def test_connection_writes_roll_back_with_outer_transaction(
+        self, engine, sample_snippet
+    ):
+        """Test that a connection-bound manager leaves the outer transaction in control"""
+        with engine.connect() as connection:
+            transaction = connection.begin()
+            manager = DatabaseManager(connection=connection)
+            manager.insert_record(Snippet, sample_snippet)
+
+            assert manager.db_url == "sqlite://"
+            assert len(manager.select_all(Snippet)) == 1
+
+            transaction.rollback()
+            assert manager.select_all(Snippet) == []
+
 
 class TestInsertSingleRecord:
     """Group all single insert-related tests"""
@@ -173,8 +281,8 @@ class TestInsertSingleRecord:
 class TestInsertRecords:
     """Group all insert-related tests"""
 
-    def test_insert_records(self, db_manager, sample_snippet):
-        n_rows = db_manager.insert_records(Snippet, [sample_snippet])
+    def test_insert_records(self, db_manager, snippet_payloads):
+        n_rows = db_manager.insert_records(Snippet, [snippet_payloads["hello_world"]])
 
         assert n_rows == 1
 
@@ -202,20 +310,107 @@ class TestInsertRecords:
             "Function Definition",
         }, "Should contain both unique snippets"
 
-    def test_insert_batched_records(
-        self, db_manager, multiple_snippets_with_duplicates
-    ):
+    def test_insert_records_validates_dict_rows(self, db_manager):
+        with pytest.raises(ValueError, match="at least 3 characters"):
+            db_manager.insert_records(Snippet, [{"title": "ab", "code": "x"}])
+
+        assert db_manager.select_all(Snippet) == []
+
+    def test_insert_batched_records(self, db_manager, snippet_payloads):
         n_rows = 7
         n_dups = 2
-        n_rows_inserted = db_manager.insert_records(
-            Snippet, multiple_snippets_with_duplicates, batch_size=3
-        )
+        records = [snippet_payloads[key] for key in DUPLICATE_PAYLOAD_KEYS]
+        n_rows_inserted = db_manager.insert_records(Snippet, records, batch_size=3)
 
         all_snippets = db_manager.select_all(Snippet)
 
         assert n_rows_inserted == len(all_snippets)
         assert n_rows - n_rows_inserted - n_dups == 0
 
+    def test_insert_records_assigns_ids(
+        self, db_manager, multiple_snippets_with_duplicates
+    ):
+        db_manager.insert_records(Snippet, multiple_snippets_with_duplicates)
+
+        ids = [s.id for s in multiple_snippets_with_duplicates]
+        stored = {s.id: s.title for s in db_manager.select_all(Snippet)}
+
+        assert ids.count(None) == 2
+        assert {
+            s.id: s.title for s in multiple_snippets_with_duplicates if s.id
+        } == stored
+
+    def test_insert_records_sends_one_insert_per_batch(self, db_manager):
+        snippets = [Snippet(title=f"title{i}", code="code") for i in range(5)]
+        inserts = []
+
+        def record_insert(conn, cursor, statement, *args):
+            if statement.startswith("INSERT"):
+                inserts.append(statement)
+
+        event.listen(db_manager.engine, "before_cursor_execute", record_insert)
+        try:
+            db_manager.insert_records(Snippet, snippets)
+        finally:
+            event.remove(db_manager.engine, "before_cursor_execute", record_insert)
+
+        assert len(inserts) == 1
+        assert sorted(s.id for s in snippets) == [1, 2, 3, 4, 5]
+
+    def test_insert_records_assigns_ids_without_unique_constraint(self, db_manager):
+        notes = [Note(body=body) for body in ("first", "second", "third")]
+
+        db_manager.insert_records(Note, notes)
+
+        stored = {note.id: note.body for note in db_manager.select_all(Note)}
+        assert {note.id: note.body for note in notes} == stored
+        assert sorted(stored) == [1, 2, 3]
+
+    def test_insert_records_retries_rejected_batch_row_by_row(self, db_manager):
+        notes = [Note(body="first"), Note(body=None), Note(body="third")]
+
+        n_rows_inserted = db_manager.insert_records(Note, notes)
+
+        assert n_rows_inserted == 2
+        assert [note.id is not None for note in notes] == [True, False, True]
+        assert {note.body for note in db_manager.select_all(Note)} == {
+            "first",
+            "third",
+        }
+
+    def test_insert_records_counts_failed_rows_apart_from_duplicates(
+        self, db_manager, mocker
+    ):
+        mock_logger = mocker.patch("snipster.database_manager.logger")
+        notes = [Note(body="first"), Note(body=None)]
+
+        db_manager.insert_records(Note, notes)
+
+        mock_logger.error.assert_called_once()
+        assert not any(
+            "duplicates" in call.args[0] for call in mock_logger.info.call_args_list
+        )
+
+    def test_insert_records_from_generator(
+        self, db_manager, multiple_snippets_with_duplicates
+    ):
+        records = (snippet for snippet in multiple_snippets_with_duplicates)
+
+        n_rows_inserted = db_manager.insert_records(Snippet, records, batch_size=3)
+
+        assert n_rows_inserted == 5
+        assert len(db_manager.select_all(Snippet)) == 5
+
+    def test_insert_records_reuses_prebuilt_statement(
+        self, db_manager, multiple_snippets
+    ):
+        db_manager.insert_records(Snippet, multiple_snippets[:1])
+        statement = db_manager._statements[(Snippet, "insert_records")]
+        db_manager.insert_records(Snippet, multiple_snippets[1:])
+
+        assert db_manager._statements[(Snippet, "insert_records")] is statement
+        assert len(db_manager.select_all(Snippet)) == 2
+
     def test_insert_empty_batch(self, db_manager):
         n_rows = 0
         n_dups = 0
@@ -246,6 +441,32 @@ class TestSelectOperations:
         result = db_manager.select_by_id(Snippet, pk=1)
         assert result is None
 
+    def test_select_column(self, db_manager, sample_snippet):
+        db_manager.insert_record(Snippet, sample_snippet)
+
+        tags = db_manager.select_column(Snippet, "tags", 1)
+
+        assert tags == "beginner, tutorial"
+
+    def test_select_column_shares_statement_with_modify(
+        self, db_manager, sample_snippet
+    ):
+        db_manager.insert_record(Snippet, sample_snippet)
+
+        db_manager.modify(Snippet, 1, "tags", lambda tags: tags)
+        statement = db_manager._statements[(Snippet, "select_column", "tags")]
+        db_manager.select_column(Snippet, "tags", 1)
+
+        assert db_manager._statements[(Snippet, "select_column", "tags")] is statement
+
+    def test_select_column_no_record(self, db_manager):
+        with pytest.raises(SnippetNotFoundError):
+            db_manager.select_column(Snippet, "tags", 999)
+
+    def test_select_column_with_non_existent_column(self, db_manager):
+        with pytest.raises(ValueError):
+            db_manager.select_column(Snippet, "dummy", 1)
+
     def test_select_all(self, db_manager, multiple_snippets):
         db_manager.insert_records(Snippet, multiple_snippets)
 
@@ -262,6 +483,28 @@ class TestSelectOperations:
         assert len(results) == 1
         assert results[0].title == "Hello World"
 
+    def test_stream_all(self, db_manager, multiple_snippets_with_duplicates):
+        db_manager.insert_records(Snippet, multiple_snippets_with_duplicates)
+
+        batches = list(db_manager.stream_all(Snippet, batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [s.id for batch in batches for s in batch] == [1, 2, 3, 4, 5]
+
+    def test_stream_all_closed_early_releases_session(self, db_manager, mocker):
+        session_cls = mocker.patch("snipster.database_manager.Session")
+        result = session_cls.return_value.__enter__.return_value.exec.return_value
+        result.partitions.return_value = iter([["first"], ["second"]])
+
+        with closing(db_manager.stream_all(Snippet)) as batches:
+            assert next(batches) == ["first"]
+
+        result.close.assert_called_once()
+        session_cls.return_value.__exit__.assert_called_once()
+
+    def test_stream_all_no_records(self, db_manager):
+        assert list(db_manager.stream_all(Snippet)) == []
+
     def test_select_filter_by_title_ignorecase(self, db_manager, sample_snippet):
         db_manager.insert_records(Snippet, [sample_snippet])
         all_snippets = db_manager.select_with_filter(Snippet, col="title", term="world")
@@ -285,6 +528,15 @@ class TestSelectOperations:
         assert len(all_snippets) == 1
         assert all_snippets[0].description == "Basic Python hello world"
 
+    def test_select_filter_by_multiple_columns(self, db_manager, multiple_snippets):
+        db_manager.insert_records(Snippet, multiple_snippets)
+        all_snippets = db_manager.select_with_filter(
+            Snippet, col=["title", "code", "description"], term="print"
+        )
+
+        assert len(all_snippets) == 2
+        assert {s.title for s in all_snippets} == {"Hello World", "For Loop"}
+
     def test_select_filter_by_empty_term(self, db_manager, multiple_snippets):
         db_manager.insert_records(Snippet, multiple_snippets)
         select_all_snippets = db_manager.select_all(Snippet)
@@ -303,6 +555,82 @@ class TestSelectOperations:
             db_manager.select_with_filter(Snippet, col="test", term="")
 
 
+class TestFullTextSearch:
+    """Group all full-text search-related tests"""
+
+    def test_create_fts_index(self, db_manager):
+        assert db_manager.has_fts_index(Snippet) is False
+
+        is_created = db_manager.create_fts_index(Snippet, ["title", "code"])
+
+        assert is_created is True
+        assert db_manager.has_fts_index(Snippet) is True
+
+    def test_create_fts_index_with_non_existent_column(self, db_manager):
+        with pytest.raises(ValueError):
+            db_manager.create_fts_index(Snippet, ["title", "dummy"])
+
+    def test_create_fts_index_indexes_existing_records(
+        self, db_manager, multiple_snippets
+    ):
+        db_manager.insert_records(Snippet, multiple_snippets)
+        db_manager.create_fts_index(Snippet, ["title", "code", "description"])
+
+        results = db_manager.select_with_fts(Snippet, "loop")
+
+        assert len(results) == 1
+        assert results[0].title == "For Loop"
+
+    def test_select_with_fts_ignorecase(self, db_manager, sample_snippet):
+        db_manager.create_fts_index(Snippet, ["title", "code", "description"])
+        db_manager.insert_record(Snippet, sample_snippet)
+
+        results = db_manager.select_with_fts(Snippet, "PYTHON HELLO")
+
+        assert len(results) == 1
+        assert results[0].description == "Basic Python hello world"
+
+    def test_select_with_fts_tracks_update_and_delete(self, db_manager, sample_snippet):
+        db_manager.create_fts_index(Snippet, ["title", "code", "description"])
+        db_manager.insert_record(Snippet, sample_snippet)
+        db_manager.update(Snippet, 1, col="description", value=None)
+
+        db_manager.update(Snippet, 1, col="title", value="Goodbye World")
+        assert db_manager.select_with_fts(Snippet, "Hello World") == []
+        assert len(db_manager.select_with_fts(Snippet, "goodbye")) == 1
+
+        db_manager.delete_record(Snippet, 1)
+        assert db_manager.select_with_fts(Snippet, "goodbye") == []
+
+    def test_fts_update_trigger_ignores_unindexed_columns(self, db_manager):
+        db_manager.create_fts_index(Snippet, ["title", "code", "description"])
+        with db_manager._begin() as conn:
+            conn.exec_driver_sql("DROP TRIGGER snippet_fts_au")
+            conn.exec_driver_sql(
+                "CREATE TRIGGER snippet_fts_au AFTER UPDATE ON snippet BEGIN SELECT 1; END"
+            )
+
+        db_manager.create_fts_index(Snippet, ["title", "code", "description"])
+
+        with db_manager._begin() as conn:
+            trigger = conn.exec_driver_sql(
+                "SELECT sql FROM sqlite_master WHERE name = 'snippet_fts_au'"
+            ).scalar()
+        assert "AFTER UPDATE OF title, code, description ON snippet" in trigger
+
+    def test_select_with_fts_quotes_operators(self, db_manager, sample_snippet):
+        db_manager.create_fts_index(Snippet, ["title", "code", "description"])
+        db_manager.insert_record(Snippet, sample_snippet)
+
+        results = db_manager.select_with_fts(Snippet, 'Hello" OR "print')
+
+        assert results == []
+
+    def test_select_with_fts_without_index(self, db_manager):
+        with pytest.raises(ValueError):
+            db_manager.select_with_fts(Snippet, "hello")
+
+
 class TestDeleteSingleRecordOperations:
     """Group all delete-related tests"""
 
@@ -320,20 +648,16 @@ class TestDeleteSingleRecordOperations:
         snippet = db_manager.select_by_id(Snippet, 1)
         assert snippet is None
 
-    def test_delete_no_record(self, mocker, db_manager):
-        mock_session = mocker.patch("snipster.database_manager.Session")
-
-        mock_session.return_value.__enter__.return_value.exec.return_value.one.side_effect = NoResultFound(
+    def test_delete_no_record(self, mock_session, db_manager):
+        mock_session.exec.return_value.one.side_effect = NoResultFound(
             "Mock DB error", None, None
         )
 
         with pytest.raises(SnippetNotFoundError):
             db_manager.delete_record(Snippet, 1)
 
-    def test_delete_multi_result_records(self, mocker, db_manager):
-        mock_session = mocker.patch("snipster.database_manager.Session")
-
-        mock_session.return_value.__enter__.return_value.exec.return_value.one.side_effect = MultipleResultsFound(
+    def test_delete_multi_result_records(self, mock_session, db_manager):
+        mock_session.exec.return_value.one.side_effect = MultipleResultsFound(
             "Mock DB error", None, None
         )
 
@@ -359,14 +683,75 @@ class TestUpdateSingleRecordOperatons:
         snippet = db_manager.select_by_id(Snippet, 1)
         assert snippet.favorite is False
 
+    def test_modify_applies_function_to_current_value(self, db_manager, sample_snippet):
+        db_manager.insert_record(Snippet, sample_snippet)
+
+        created = db_manager.select_by_id(Snippet, 1)
+
+        value = db_manager.modify(Snippet, 1, "tags", lambda tags: f"{tags}, extra")
+
+        modified = db_manager.select_by_id(Snippet, 1)
+        assert value == "beginner, tutorial, extra"
+        assert modified.tags == value
+        assert modified.updated_at > created.updated_at
+
+    def test_modify_no_record(self, db_manager):
+        with pytest.raises(SnippetNotFoundError):
+            db_manager.modify(Snippet, 999, "tags", lambda tags: tags)
+
+    def test_update_reuses_prebuilt_statement(self, db_manager, sample_snippet):
+        db_manager.insert_record(Snippet, sample_snippet)
+
+        db_manager.update(Snippet, 1, col="favorite", value=True)
+        statement = db_manager._statements[(Snippet, "modify", "favorite")]
+        db_manager.update(Snippet, 1, col="favorite", value=False)
+
+        assert db_manager._statements[(Snippet, "modify", "favorite")] is statement
+        assert db_manager.select_by_id(Snippet, 1).favorite is False
+
+    @pytest.mark.parametrize(
+        "col,value",
+        [("title", "ab"), ("language", "Cobol"), ("favorite", "maybe")],
+        ids=["short_title", "unknown_language", "non_bool_favorite"],
+    )
+    def test_update_validates_value(self, db_manager, sample_snippet, col, value):
+        db_manager.insert_record(Snippet, sample_snippet)
+
+        with pytest.raises(ValidationError):
+            db_manager.update(Snippet, 1, col=col, value=value)
+
+        assert db_manager.select_by_id(Snippet, 1).title == "Hello World"
+
+    def test_update_stores_validated_value(self, db_manager, sample_snippet):
+        db_manager.insert_record(Snippet, sample_snippet)
+
+        db_manager.update(Snippet, 1, col="language", value="TypeScript")
+
+        assert db_manager.select_by_id(Snippet, 1).language == Language.TYPESCRIPT
+
     def test_update_with_non_existent_column(self, db_manager):
         with pytest.raises(ValueError):
             db_manager.update(Snippet, 1, col="dummy", value=False)
 
-    def test_update_no_record(self, mocker, db_manager):
-        mock_session = mocker.patch("snipster.database_manager.Session")
+    def test_toggle_single_record(self, db_manager, sample_snippet):
+        db_manager.insert_record(Snippet, sample_snippet)
+
+        assert db_manager.toggle(Snippet, 1, col="favorite") is True
+        assert db_manager.select_by_id(Snippet, 1).favorite is True
+
+        assert db_manager.toggle(Snippet, 1, col="favorite") is False
+        assert db_manager.select_by_id(Snippet, 1).favorite is False
+
+    def test_toggle_no_record(self, db_manager):
+        with pytest.raises(SnippetNotFoundError):
+            db_manager.toggle(Snippet, 999, col="favorite")
 
-        mock_session.return_value.__enter__.return_value.exec.return_value.one.side_effect = NoResultFound(
+    def test_toggle_with_non_existent_column(self, db_manager):
+        with pytest.raises(ValueError):
+            db_manager.toggle(Snippet, 1, col="dummy")
+
+    def test_update_no_record(self, mock_session, db_manager):
+        mock_session.exec.return_value.one.side_effect = NoResultFound(
             "Mock DB error", None, None
         )
 
@@ -374,73 +759,82 @@ class TestUpdateSingleRecordOperatons:
             db_manager.update(Snippet, 999, col="favorite", value=True)
 
 
+# Scenario name -> (session method that fails, operation, exception surfaced)
+OPERATIONAL_ERROR_SCENARIOS = {
+    "delete_record": (
+        "commit",
+        lambda db, s: db.delete_record(Snippet, 1),
+        RepositoryError,
+    ),
+    "insert_record": (
+        "commit",
+        lambda db, s: db.insert_record(Snippet, s),
+        RepositoryError,
+    ),
+    # Failed batches are logged and skipped rather than raised
+    "insert_records": ("commit", lambda db, s: db.insert_records(Snippet, [s]), None),
+    "select_by_id": (
+        "get",
+        lambda db, s: db.select_by_id(Snippet, pk=1),
+        RepositoryError,
+    ),
+    "select_column": (
+        "exec",
+        lambda db, s: db.select_column(Snippet, "tags", pk=1),
+        RepositoryError,
+    ),
+    "select_all": ("exec", lambda db, s: db.select_all(Snippet), RepositoryError),
+    "stream_all": (
+        "exec",
+        lambda db, s: list(db.stream_all(Snippet)),
+        RepositoryError,
+    ),
+    "select_with_filter": (
+        "exec",
+        lambda db, s: db.select_with_filter(Snippet, col="title"),
+        RepositoryError,
+    ),
+    "update": (
+        "exec",
+        lambda db, s: db.update(Snippet, pk=1, col="favorite", value=True),
+        RepositoryError,
+    ),
+    "toggle": (
+        "exec",
+        lambda db, s: db.toggle(Snippet, pk=1, col="favorite"),
+        RepositoryError,
+    ),
+}
+
+
 @pytest.mark.parametrize(
-    "error_scenarios",
-    [
-        "delete_record",
-        "insert_record",
-        "insert_records",
-        "select_by_id",
-        "select_all",
-        "select_with_filter",
-        "update",
-    ],
+    "session_method,operation,expected_error",
+    OPERATIONAL_ERROR_SCENARIOS.values(),
+    ids=OPERATIONAL_ERROR_SCENARIOS.keys(),
 )
 def test_operational_errors_are_logged(
-    db_manager, mocker, sample_snippet, error_scenarios
+    db_manager, error_mocks, sample_snippet, session_method, operation, expected_error
 ):
     """Test that all DB operations log OperationalError properly"""
-    mock_logger = mocker.patch("snipster.database_manager.logger")
-    mock_session = mocker.patch("snipster.database_manager.Session")
+    mock_logger, session = error_mocks
+    getattr(session, session_method).side_effect = OperationalError(
+        "Mock DB error", None, None
+    )
 
-    if error_scenarios == "delete_record":
-        mock_session.return_value.__enter__.return_value.commit.side_effect = (
-            OperationalError("Mock DB error", None, None)
-        )
-        with pytest.raises(RepositoryError):
-            db_manager.delete_record(Snippet, 1)
-    elif error_scenarios == "insert_records":
-        mock_session.return_value.__enter__.return_value.commit.side_effect = (
-            OperationalError("Mock DB error", None, None)
-        )
-        db_manager.insert_records(Snippet, [sample_snippet])
-    elif error_scenarios == "insert_record":
-        mock_session.return_value.__enter__.return_value.commit.side_effect = (
-            IntegrityError("Mock DB error", None, None)
-        )
-        with pytest.raises(DuplicateSnippetError):
-            db_manager.insert_record(Snippet, sample_snippet)
-        mock_logger.warning.assert_called_once()
+    with pytest.raises(expected_error) if expected_error else nullcontext():
+        operation(db_manager, sample_snippet)
 
-        mock_session.return_value.__enter__.return_value.commit.side_effect = (
-            OperationalError("Mock DB error", None, None)
-        )
-        with pytest.raises(RepositoryError):
-            db_manager.insert_record(Snippet, sample_snippet)
-    elif error_scenarios == "select_by_id":
-        mock_session.return_value.__enter__.return_value.get.side_effect = (
-            OperationalError("Mock DB error", None, None)
-        )
-        with pytest.raises(RepositoryError):
-            db_manager.select_by_id(Snippet, pk=1)
-    elif error_scenarios == "select_all":
-        mock_session.return_value.__enter__.return_value.exec.side_effect = (
-            OperationalError("Mock DB error", None, None)
-        )
-        with pytest.raises(RepositoryError):
-            db_manager.select_all(Snippet)
-    elif error_scenarios == "select_with_filter":
-        mock_session.return_value.__enter__.return_value.exec.side_effect = (
-            OperationalError("Mock DB error", None, None)
-        )
-        with pytest.raises(RepositoryError):
-            db_manager.select_with_filter(Snippet, col="title")
-    elif error_scenarios == "update":
-        mock_session.return_value.__enter__.return_value.exec.side_effect = (
-            OperationalError("Mock DB error", None, None)
-        )
-        with pytest.raises(RepositoryError):
-            db_manager.update(Snippet, pk=1, col="favorite", value=True)
+    mock_logger.error.assert_called_once()
 
-    if error_scenarios != "insert_record":
-        mock_logger.error.assert_called_once()
+
+def test_insert_record_integrity_error_is_logged(
+    db_manager, error_mocks, sample_snippet
+):
+    """Test that a commit-time IntegrityError is logged and raised as a duplicate"""
+    mock_logger, session = error_mocks
+    session.commit.side_effect = IntegrityError("Mock DB error", None, None)
+
+    with pytest.raises(DuplicateSnippetError):
+        db_manager.insert_record(Snippet, sample_snippet)
+
+    mock_logger.warning.assert_called_once()
@@ -18,3 +18,10 @@ def test_language_is_string_enum():
     """Test Language inherits from str"""
     assert isinstance(Language.PYTHON, str)
     assert Language.PYTHON == "Python"
+
+
+def test_language_lookup_is_case_insensitive():
+    """Test Language.lookup resolves names regardless of casing"""
+    assert Language.lookup("python") is Language.PYTHON
+    assert Language.lookup("TYPESCRIPT") is Language.TYPESCRIPT
+    assert Language.lookup("Rust") is None